@@ -104,6 +104,7 @@ class JobResource(resources.ModelResource):
 class EmployerResource(resources.ModelResource):
     class Meta:
         model = Employer
+        exclude = ("company_display",)  # generated by the database, never imported
 
 
 class JobSeekerResource(resources.ModelResource):
@@ -254,10 +255,10 @@ def disable_email_templates(modeladmin, request, queryset):
 
 
 def _posting_duration_days_default() -> int:
-    s = SiteSettings.objects.first()
-    if s and getattr(s, "posting_duration_days", None):
+    days = SiteSettings.objects.first_value("posting_duration_days")
+    if days:
         try:
-            return int(s.posting_duration_days)
+            return int(days)
         except Exception:
             pass
     return 30
@@ -330,10 +331,11 @@ class JobAdmin(ImportExportModelAdmin):
         "posting_date",
         "expiry_date",
         "is_active",
+        "is_currently_active",
         "is_featured",
         "source",
     )
-    list_filter = ("is_featured", "is_active", "posting_date")
+    list_filter = ("is_featured", "is_active", "is_currently_active", "posting_date")
     search_fields = ("title", "location", "employer__company_name")
 
 
@@ -437,6 +439,18 @@ class InvoiceAdmin(ImportExportModelAdmin):
     )
     list_filter = ("processor", "status", "order_date")
     search_fields = ("employer__company_name", "processor_reference", "discount_code")
+    # Monthly totals table under the list (import-export wraps this template with its buttons)
+    change_list_template = "admin/board/invoice/change_list.html"
+
+    def changelist_view(self, request, extra_context=None):
+        response = super().changelist_view(request, extra_context)
+        cl = getattr(response, "context_data", {}).get("cl")  # absent on redirects (e.g. bulk actions)
+        if cl is not None:
+            # Summed by the database over the current filters/search, not the visible page
+            response.context_data["monthly_totals"] = [
+                (month, f"${(total or 0) / 100:.2f}") for month, total in cl.queryset.monthly_totals()
+            ]
+        return response
 
 
 @admin.register(DiscountCode)
@@ -29,7 +29,7 @@ def site_settings(request):
 
     try:
         # Try to fetch the first row; any missing column/table will raise OperationalError/ProgrammingError
-        obj = SiteSettings.objects.first()
+        obj = SiteSettings.objects.current()
         return {"sitesettings": obj or Empty()}
     except (OperationalError, ProgrammingError, ImproperlyConfigured):
         # Table/column missing or not ready — return safe empty
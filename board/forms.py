@@ -7,7 +7,7 @@ from django import forms
 from django.contrib.auth.forms import AuthenticationForm, UserCreationForm
 from django.contrib.auth import get_user_model
 
-from .models import Employer, JobSeeker, Job, Application, Resume
+from .models import ApplyVia, Employer, JobSeeker, Job, JobType, Application, Resume
 
 
 User = get_user_model()
@@ -134,14 +134,7 @@ class EmployerSignUpForm(StyledFormMixin, UserCreationForm):
 # ============================================================
 
 YES_NO_CHOICES = (("yes", "Yes"), ("no", "No"))
-OPPORTUNITY_CHOICES = (
-    ("full_time", "Full-time"),
-    ("part_time", "Part-time"),
-    ("contractor", "Contractor"),
-    ("casual", "Casual"),
-    ("locum", "Locum"),
-    ("temporary", "Temporary"),
-)
+OPPORTUNITY_CHOICES = JobType.choices
 
 
 class JobSeekerSignUpForm(StyledFormMixin, UserCreationForm):
@@ -252,14 +245,7 @@ class JobSeekerSignUpForm(StyledFormMixin, UserCreationForm):
 # (Kept as-is from your provided file)
 # ============================================================
 
-JOB_TYPE_CHOICES = (
-    ("full_time", "Full-time"),
-    ("part_time", "Part-time"),
-    ("contractor", "Contractor"),
-    ("casual", "Casual"),
-    ("locum", "Locum"),
-    ("temporary", "Temporary"),
-)
+JOB_TYPE_CHOICES = JobType.choices
 
 COMPENSATION_TYPE_CHOICES = (
     ("hourly", "Hourly"),
@@ -267,10 +253,7 @@ COMPENSATION_TYPE_CHOICES = (
     ("split", "Split"),
 )
 
-APPLY_VIA_CHOICES = (
-    ("email", "Email"),
-    ("url", "URL"),
-)
+APPLY_VIA_CHOICES = ApplyVia.choices
 
 YES_NO_SELECT = (("yes", "Yes"), ("no", "No"))
 
@@ -281,8 +264,9 @@ class JobForm(StyledFormMixin, forms.ModelForm):
         required=True,
     )
 
-    def __init__(self, *args, max_expiry_date=None, **kwargs):
+    def __init__(self, *args, max_expiry_date=None, min_expiry_date=None, **kwargs):
         self.max_expiry_date = max_expiry_date
+        self.min_expiry_date = min_expiry_date
         super().__init__(*args, **kwargs)
 
         self.fields["job_type"].choices = [("", "Select…")] + list(JOB_TYPE_CHOICES)
@@ -292,6 +276,8 @@ class JobForm(StyledFormMixin, forms.ModelForm):
         # Optional: clamp max expiry client-side too (server enforces in clean_expiry_date)
         if self.max_expiry_date and "expiry_date" in self.fields:
             self.fields["expiry_date"].widget.attrs["max"] = self.max_expiry_date.isoformat()
+        if self.min_expiry_date and "expiry_date" in self.fields:
+            self.fields["expiry_date"].widget.attrs["min"] = self.min_expiry_date.isoformat()
 
     class Meta:
         model = Job
@@ -322,6 +308,8 @@ class JobForm(StyledFormMixin, forms.ModelForm):
         expiry = self.cleaned_data.get("expiry_date")
         if self.max_expiry_date and expiry and expiry > self.max_expiry_date:
             raise forms.ValidationError("Expiry date exceeds the maximum allowed posting duration.")
+        if self.min_expiry_date and expiry and expiry < self.min_expiry_date:
+            raise forms.ValidationError("Expiry date has already passed. Pick a date from today onward.")
         return expiry
 
     def save(self, commit=True):
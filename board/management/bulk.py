@@ -0,0 +1,164 @@
+"""
+Bulk read/write helpers shared by the CSV import commands.
+
+Postgres (production) gets COPY FROM STDIN; every other backend (local SQLite)
+falls back to a batched bulk_create so the commands behave the same everywhere.
+"""
+from __future__ import annotations
+
+import csv
+import io
+import mmap
+from contextlib import contextmanager
+from typing import Iterable, Sequence
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import connection
+from django.db.models.functions import Lower
+
+# Keeps IN (...) lists well under backend parameter limits (SQLite: 32766, older builds: 999)
+LOOKUP_CHUNK_SIZE = 900
+
+
+def read_csv_rows(path) -> list[dict]:
+    """
+    Read a whole CSV export into a list of DictReader rows.
+    The file is memory-mapped and decoded in one call (utf-8-sig strips the BOM Excel adds),
+    so the csv module parses one contiguous string instead of pulling buffered lines from disk.
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file: nothing to map
+            return []
+        with mm:
+            text = str(mm, "utf-8-sig")
+    return list(csv.DictReader(io.StringIO(text, newline="")))
+
+
+def _insert_fields(model):
+    return [f for f in model._meta.concrete_fields if not f.primary_key and not f.generated]
+
+
+def bulk_lookup(
+    queryset,
+    field: str,
+    values: Iterable[str],
+    *,
+    iexact: bool = False,
+    fields: Sequence[str] | None = None,
+) -> dict:
+    """
+    Resolve many single-row lookups with a handful of IN queries instead of one query per CSV row.
+    Returns {value: obj}; when several rows match, the first one in queryset order wins,
+    mirroring queryset.filter(**{field: value}).first().
+    With iexact=True, values must already be lowercased and matching uses LOWER(field).
+    With fields=[...], rows come back as plain tuples of those columns (values_list) instead of model instances.
+    """
+    wanted = sorted({v for v in values if v})
+    if iexact:
+        queryset = queryset.annotate(_lookup_key=Lower(field))
+        key_field = "_lookup_key"
+    else:
+        key_field = field
+
+    found = {}
+    for i in range(0, len(wanted), LOOKUP_CHUNK_SIZE):
+        chunk = wanted[i : i + LOOKUP_CHUNK_SIZE]
+        qs = queryset.filter(**{f"{key_field}__in": chunk})
+        if fields:
+            for key, *row in qs.values_list(key_field, *fields):
+                found.setdefault(key, tuple(row))
+        else:
+            for obj in qs:
+                found.setdefault(getattr(obj, key_field), obj)
+    return found
+
+
+def bulk_create_users(emails: Iterable[str], batch_size: int = 1000, **extra) -> None:
+    """
+    Create one User per email (username=email, unusable password) in batched INSERTs.
+    Same result as create_user(password=None) per row, minus the per-row hashing/save round-trips.
+    Emails that collide with an existing username are skipped (ignore_conflicts); callers re-query.
+    """
+    User = get_user_model()
+    password = make_password(None)
+    User.objects.bulk_create(
+        [User(username=e, email=e, password=password, **extra) for e in emails],
+        batch_size=batch_size,
+        ignore_conflicts=True,
+    )
+
+
+def copy_insert(model, objs: Sequence, batch_size: int = 1000) -> int:
+    """
+    Insert unsaved model instances in one pass and return the number of rows written.
+    - Postgres: stream rows through COPY (one statement, no per-row INSERT parsing)
+    - Other backends: bulk_create in batches
+    Like bulk_create, this does NOT call save() or send signals, and PKs are not set on objs.
+    """
+    if not objs:
+        return 0
+
+    with connection.cursor() as cur:
+        raw = getattr(cur, "cursor", None)
+        if connection.vendor != "postgresql" or not hasattr(raw, "copy"):
+            model.objects.bulk_create(objs, batch_size=batch_size)
+            return len(objs)
+
+        fields = _insert_fields(model)
+        qn = connection.ops.quote_name
+        sql = "COPY {} ({}) FROM STDIN".format(
+            qn(model._meta.db_table),
+            ", ".join(qn(f.column) for f in fields),
+        )
+
+        with raw.copy(sql) as copy:
+            for obj in objs:
+                # pre_save(add=True) fills auto_now/auto_now_add exactly like Model.save()
+                copy.write_row([f.get_db_prep_save(f.pre_save(obj, True), connection) for f in fields])
+
+    return len(objs)
+
+
+@contextmanager
+def deferred_indexes(model):
+    """
+    Drop the table's non-unique secondary indexes for the duration of a bulk load and rebuild them after.
+    Building an index once over the loaded table is cheaper than maintaining it row by row during COPY.
+    - Postgres only (DDL is transactional there, so a failed load rolls the DROPs back too)
+    - Unique/primary indexes are kept: they enforce constraints
+    - Must run inside transaction.atomic(); other backends are a no-op
+    """
+    if connection.vendor != "postgresql":
+        yield
+        return
+
+    with connection.cursor() as cur:
+        cur.execute(
+            """
+            SELECT i.indexname, i.indexdef
+            FROM pg_indexes i
+            JOIN pg_index x
+              ON x.indexrelid = (quote_ident(i.schemaname) || '.' || quote_ident(i.indexname))::regclass
+            WHERE i.schemaname = current_schema()
+              AND i.tablename = %s
+              AND NOT x.indisunique
+              AND NOT x.indisprimary
+            """,
+            [model._meta.db_table],
+        )
+        indexes = cur.fetchall()
+        for name, _ in indexes:
+            cur.execute(f"DROP INDEX {connection.ops.quote_name(name)}")
+
+    yield
+
+    with connection.cursor() as cur:
+        # The load queued deferred FK checks, and Postgres won't build an index over a table with pending
+        # trigger events: run those checks now, then restore Django's INITIALLY DEFERRED default
+        cur.execute("SET CONSTRAINTS ALL IMMEDIATE")
+        cur.execute("SET CONSTRAINTS ALL DEFERRED")
+        for _, definition in indexes:
+            cur.execute(definition)
@@ -43,7 +43,7 @@ class Command(BaseCommand):
         We fetch only text casts produced by the DB so Django doesn't try to parse them on read.
         """
         qs = (
-            Job.objects.only("id")  # don't load actual posting_date/created_at
+            Job.objects.bare().only("id")  # don't load actual posting_date/created_at
             .annotate(
                 posting_date_txt=Cast(F("posting_date"), CharField()),
                 created_at_txt=Cast(F("created_at"), CharField()),
@@ -64,7 +64,7 @@ class Command(BaseCommand):
             new_ca = _parse_dt_from_text(ca_txt)
 
             # Fetch a single instance by id; now we will overwrite with safe values.
-            job = Job.objects.only("id").get(pk=job_id)
+            job = Job.objects.bare().only("id").get(pk=job_id)
             update_fields = []
 
             # For posting_date: keep None if invalid text
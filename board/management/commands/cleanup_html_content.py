@@ -55,7 +55,7 @@ class Command(BaseCommand):
                     e.save(update_fields=["company_description"])
 
         # Jobs
-        qs_j = Job.objects.all().only("id", "description")
+        qs_j = Job.objects.bare().only("id", "description")
         if limit:
             qs_j = qs_j[:limit]
 
@@ -0,0 +1,58 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from django.utils import timezone
+
+from board.models import Job
+
+
+class Command(BaseCommand):
+    help = (
+        "Clear Job.is_currently_active on jobs whose expiry_date has passed, so listings can filter on "
+        "the stored flag. Run on a schedule, or keep it running with --every (see the Procfile worker)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true")
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument(
+            "--every",
+            type=int,
+            default=0,
+            help="Keep running and sweep every N seconds (e.g. 3600). Default: sweep once and exit.",
+        )
+
+    def handle(self, *args, **opts):
+        dry_run = bool(opts["dry_run"])
+        batch_size = max(1, int(opts["batch_size"]))
+        every = max(0, int(opts["every"]))
+
+        while True:
+            self.sweep(dry_run, batch_size)
+            if not every or dry_run:
+                return
+            # Don't hold a connection the database may have dropped while this process sleeps
+            close_old_connections()
+            time.sleep(every)
+
+    def sweep(self, dry_run: bool, batch_size: int) -> None:
+        today = timezone.localdate()
+
+        expired = Job.objects.bare().filter(is_currently_active=True, expiry_date__lt=today)
+
+        if dry_run:
+            self.stdout.write(f"[expire_jobs] DRY-RUN: would expire {expired.count()} job(s).")
+            return
+
+        # pk batches keep each UPDATE (and its row locks) short on a large jobs table
+        total = 0
+        while True:
+            ids = list(expired.order_by("pk").values_list("pk", flat=True)[:batch_size])
+            if not ids:
+                break
+            total += Job.objects.bare().filter(pk__in=ids).update(
+                is_currently_active=False, updated_at=timezone.now()
+            )
+
+        self.stdout.write(self.style.SUCCESS(f"[expire_jobs] expired={total}"))
@@ -1,12 +1,14 @@
-import csv
 import re
+from functools import lru_cache
 from pathlib import Path
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.management.base import BaseCommand
-from django.db import transaction
+from django.db import IntegrityError, transaction
+from django.utils import timezone
 
+from board.management.bulk import bulk_create_users, bulk_lookup, read_csv_rows
 from board.models import Employer
 
 
@@ -14,15 +16,39 @@ def _norm(val) -> str:
     return (val or "").strip()
 
 
+# Columns an import rewrites on an existing employer
+UPDATE_FIELDS = [
+    "user",
+    "email",
+    "company_name",
+    "company_description",
+    "phone",
+    "website",
+    "location",
+    "is_approved",
+    "login_active",
+    "updated_at",
+]
+
+
 def _strip_html(text: str) -> str:
     if not text:
         return ""
+    # Fast path: plain-text descriptions have nothing for the regexes to do
+    if "<" not in text and "\n\n\n" not in text:
+        return text.strip()
     text = re.sub(r"<br\s*/?>", "\n", text, flags=re.I)
     text = re.sub(r"</p\s*>", "\n", text, flags=re.I)
     text = re.sub(r"<[^>]+>", "", text)
     return re.sub(r"\n{3,}", "\n\n", text).strip()
 
 
+@lru_cache(maxsize=None)
+def _max_lengths(model_cls) -> dict:
+    # Field introspection once per model, not once per row/field
+    return {f.name: f.max_length for f in model_cls._meta.concrete_fields if getattr(f, "max_length", None)}
+
+
 def _truncate_for_model(model_cls, field_name: str, value: str) -> str:
     """
     Truncate string values to the model field's max_length (if any).
@@ -31,16 +57,15 @@ def _truncate_for_model(model_cls, field_name: str, value: str) -> str:
     if value is None:
         return ""
     value = str(value).strip()
+    max_len = _max_lengths(model_cls).get(field_name)
+    if max_len and len(value) > max_len:
+        return value[:max_len]
+    return value
 
-    try:
-        field = model_cls._meta.get_field(field_name)
-        max_len = getattr(field, "max_length", None)
-        if max_len and len(value) > max_len:
-            return value[:max_len]
-    except Exception:
-        pass
 
-    return value
+def _row_email(row) -> str:
+    email = _norm(row.get("Email") or row.get("email") or row.get("Employer Email") or "").lower()
+    return _truncate_for_model(Employer, "email", email)
 
 
 def status_from_filename(filename: str) -> str:
@@ -88,78 +113,106 @@ class Command(BaseCommand):
                     f"\n--- Importing: {path.name} | status={status} (is_approved={is_approved}, login_active={login_active}) ---"
                 )
 
-                with path.open(newline="", encoding="utf-8-sig") as f:
-                    reader = csv.DictReader(f)
-
-                    for idx, row in enumerate(reader, start=2):
-                        try:
-                            # --- Required ---
-                            email = _norm(row.get("Email") or row.get("email") or row.get("Employer Email") or "").lower()
-                            if not email:
-                                skipped += 1
-                                continue
-
-                            company_name = _norm(
-                                row.get("Company Name")
-                                or row.get("Company")
-                                or row.get("Clinic")
-                                or row.get("Employer Name")
-                                or ""
-                            )
-
-                            # --- Optional fields (keep your existing mappings) ---
-                            phone = _norm(row.get("Phone") or row.get("phone") or "")
-                            website = _norm(row.get("Website") or row.get("website") or "")
-                            location = _norm(row.get("Location") or row.get("location") or "")
-
-                            # Some files have long HTML-ish descriptions
-                            company_description = _strip_html(_norm(row.get("Company Description") or row.get("Description") or ""))
-
-                            # ---- TRUNCATE to model max_length (prevents varchar(200) crash) ----
-                            email = _truncate_for_model(Employer, "email", email)
-                            company_name = _truncate_for_model(Employer, "company_name", company_name)
-                            phone = _truncate_for_model(Employer, "phone", phone)
-                            website = _truncate_for_model(Employer, "website", website)
-                            location = _truncate_for_model(Employer, "location", location)
-
-                            # company_description is usually TextField; still cap for sanity (won't break DB)
-                            company_description = (company_description or "")[:5000]
-
-                            # Create/ensure user
-                            user = User.objects.filter(email__iexact=email).first()
-                            if not user:
-                                user = User.objects.create_user(username=email, email=email, password=None)
-                                user.set_unusable_password()
-                                user.save(update_fields=["password"])
-
-                            # Create or update employer
-                            employer = Employer.objects.filter(email__iexact=email).first()
-                            data = {
-                                "user": user,
-                                "email": email,
-                                "company_name": company_name or email,
-                                "company_description": company_description,
-                                "phone": phone,
-                                "website": website,
-                                "location": location,
-                                "is_approved": bool(is_approved),
-                                "login_active": bool(login_active),
-                            }
-
-                            if employer:
-                                for k, v in data.items():
-                                    setattr(employer, k, v)
-                                if not dry_run:
-                                    employer.save()
-                                updated += 1
-                            else:
-                                if not dry_run:
-                                    Employer.objects.create(**data)
-                                created += 1
-
-                        except Exception as e:
-                            errors += 1
-                            self.stderr.write(f"[Row {idx}] ERROR: {e}")
+                rows = read_csv_rows(path)
+
+                # Pass 1: resolve existing users/employers for the whole file in a few IN queries
+                emails = [_row_email(row) for row in rows]
+                users_by_email = bulk_lookup(User.objects.order_by("pk"), "email", emails, iexact=True)
+                employers_by_email = bulk_lookup(Employer.objects.all(), "email", emails)
+
+                # Create every missing user in batched INSERTs, then pick them up with the same lookup
+                new_emails = sorted({e for e in emails if e and e not in users_by_email})
+                if new_emails:
+                    bulk_create_users(new_emails)
+                    users_by_email.update(bulk_lookup(User.objects.order_by("pk"), "email", new_emails, iexact=True))
+
+                # Existing employers are changed in memory and written with bulk_update after the loop
+                to_update: dict[int, Employer] = {}
+                now = timezone.now()
+
+                for idx, row in enumerate(rows, start=2):
+                    try:
+                        # --- Required ---
+                        email = _row_email(row)
+                        if not email:
+                            skipped += 1
+                            continue
+
+                        company_name = _norm(
+                            row.get("Company Name")
+                            or row.get("Company")
+                            or row.get("Clinic")
+                            or row.get("Employer Name")
+                            or ""
+                        )
+
+                        # --- Optional fields (keep your existing mappings) ---
+                        phone = _norm(row.get("Phone") or row.get("phone") or "")
+                        website = _norm(row.get("Website") or row.get("website") or "")
+                        location = _norm(row.get("Location") or row.get("location") or "")
+
+                        # Some files have long HTML-ish descriptions
+                        company_description = _strip_html(_norm(row.get("Company Description") or row.get("Description") or ""))
+
+                        # ---- TRUNCATE to model max_length (prevents varchar(200) crash) ----
+                        company_name = _truncate_for_model(Employer, "company_name", company_name)
+                        phone = _truncate_for_model(Employer, "phone", phone)
+                        website = _truncate_for_model(Employer, "website", website)
+                        location = _truncate_for_model(Employer, "location", location)
+
+                        # company_description is usually TextField; still cap for sanity (won't break DB)
+                        company_description = (company_description or "")[:5000]
+
+                        # Ensure user (normally created above; fallback surfaces e.g. a username clash as a row error)
+                        user = users_by_email.get(email)
+                        if not user:
+                            user = User.objects.create_user(username=email, email=email, password=None)
+                            users_by_email[email] = user
+
+                        # Create or update employer
+                        employer = employers_by_email.get(email)
+                        data = {
+                            "user": user,
+                            "email": email,
+                            "company_name": company_name or email,
+                            "company_description": company_description,
+                            "phone": phone,
+                            "website": website,
+                            "location": location,
+                            "is_approved": bool(is_approved),
+                            "login_active": bool(login_active),
+                        }
+
+                        if employer:
+                            for k, v in data.items():
+                                setattr(employer, k, v)
+                            employer.updated_at = now  # bulk_update skips auto_now
+                            to_update[employer.pk] = employer
+                            updated += 1
+                        else:
+                            if not dry_run:
+                                employers_by_email[email] = Employer.objects.create(**data)
+                            created += 1
+
+                    except Exception as e:
+                        errors += 1
+                        self.stderr.write(f"[Row {idx}] ERROR: {e}")
+
+                if to_update and not dry_run:
+                    try:
+                        with transaction.atomic():
+                            Employer.objects.bulk_update(list(to_update.values()), UPDATE_FIELDS, batch_size=500)
+                    except IntegrityError:
+                        # One conflicting row (e.g. user already linked elsewhere) shouldn't sink the file:
+                        # redo this batch row by row so only the bad rows are reported
+                        for employer in to_update.values():
+                            try:
+                                with transaction.atomic():
+                                    employer.save(update_fields=UPDATE_FIELDS)
+                            except Exception as e:
+                                updated -= 1
+                                errors += 1
+                                self.stderr.write(f"[Employer {employer.email}] ERROR: {e}")
 
             if dry_run:
                 transaction.set_rollback(True)
@@ -5,6 +5,7 @@ import csv
 import re
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
@@ -13,14 +14,22 @@ from django.core.management.base import BaseCommand
 from django.db import transaction
 from django.utils import timezone
 
+from board.management.bulk import bulk_lookup
 from board.models import Employer, Invoice
 
 
+# Placeholder values some exports write for empty cells (built once, not per call)
+_SENTINELS = frozenset({"nan", "none", "null"})
+
+
 def _clean(s: Any) -> str:
     if s is None:
         return ""
-    val = str(s).strip()
-    return "" if val.lower() in {"nan", "none", "null"} else val
+    val = (s if isinstance(s, str) else str(s)).strip()
+    # Sentinels are 3-4 chars: skip the lower() + set probe for everything else (emails, names, amounts)
+    if 3 <= len(val) <= 4 and val.lower() in _SENTINELS:
+        return ""
+    return val
 
 
 def _lower(s: Any) -> str:
@@ -45,6 +54,13 @@ def _parse_date_to_dt(s: Any):
     s = _clean(s)
     if not s:
         return timezone.now()
+    dt = _parse_invoice_day(s)
+    return dt if dt is not None else timezone.now()
+
+
+@lru_cache(maxsize=4096)
+def _parse_invoice_day(s: str):
+    # Invoices share a small set of dates, so each distinct string is parsed (strptime) only once
     for fmt in ("%b %d, %Y", "%B %d, %Y", "%Y-%m-%d"):
         try:
             d = datetime.strptime(s, fmt)
@@ -52,7 +68,7 @@ def _parse_date_to_dt(s: Any):
             return timezone.make_aware(datetime(d.year, d.month, d.day, 12, 0, 0))
         except Exception:
             continue
-    return timezone.now()
+    return None
 
 
 def _parse_total_to_cents(s: Any) -> int:
@@ -125,10 +141,22 @@ class Command(BaseCommand):
                 raise ValueError(f"CSV missing required columns: {missing}. Found headers: {headers}")
 
             stats = ImportStats()
+            rows = list(reader)
+
+            # Pass 1: fetch every invoice this file already has in the DB (in_bulk batches the IN list)
+            invoices_by_id = Invoice.objects.in_bulk({i for i in (_parse_int(r.get("Invoice #")) for r in rows) if i})
+
+            # ...and every employer whose company_name matches a customer exactly (case-insensitive)
+            employers_by_name = bulk_lookup(
+                Employer.objects.all(),
+                "company_name",
+                (_lower(r.get("Customer Name")) for r in rows),
+                iexact=True,
+            )
             ctx = transaction.atomic() if not dry_run else _NoopCtx()
 
             with ctx:
-                for idx, row in enumerate(reader, start=2):
+                for idx, row in enumerate(rows, start=2):
                     try:
                         inv_id = _parse_int(row.get("Invoice #"))
                         customer = _clean(row.get("Customer Name"))
@@ -136,14 +164,15 @@ class Command(BaseCommand):
                             stats.skipped += 1
                             continue
 
-                        # Match Employer by company_name (case-insensitive exact match)
-                        employer = Employer.objects.filter(company_name__iexact=customer).first()
+                        # Match Employer by company_name (case-insensitive exact match, prefetched above)
+                        key = customer.lower()
+                        employer = employers_by_name.get(key)
 
-                        # If not found, try a looser match (unique contains)
-                        if not employer:
-                            qs = Employer.objects.filter(company_name__icontains=customer).order_by("id")
-                            if qs.count() == 1:
-                                employer = qs.first()
+                        # If not found, try a looser match (unique contains); resolved once per customer
+                        if not employer and key not in employers_by_name:
+                            # Fetching 2 rows answers "exactly one?" in one query (no COUNT + SELECT)
+                            candidates = list(Employer.objects.filter(company_name__icontains=customer).order_by("id")[:2])
+                            employers_by_name[key] = employer = candidates[0] if len(candidates) == 1 else None
 
                         if not employer:
                             stats.skipped += 1
@@ -165,7 +194,7 @@ class Command(BaseCommand):
                         if len(default_currency) > 10:
                             raise ValueError("currency too long (>10)")
 
-                        existing = Invoice.objects.filter(id=inv_id).first()
+                        existing = invoices_by_id.get(inv_id)
 
                         if dry_run:
                             if existing:
@@ -191,6 +220,7 @@ class Command(BaseCommand):
                         inv.discount_code = inv.discount_code or ""
 
                         inv.save()
+                        invoices_by_id[inv_id] = inv
 
                         if existing:
                             stats.updated += 1
@@ -1,5 +1,7 @@
-import csv
+import sys
+from contextlib import nullcontext
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -7,6 +9,7 @@ from django.conf import settings
 from django.core.management.base import BaseCommand
 from django.db import transaction
 
+from board.management.bulk import bulk_lookup, copy_insert, deferred_indexes, read_csv_rows
 from board.models import Employer, Job
 
 
@@ -27,23 +30,40 @@ POSTING_DATE_KEYS = ["Posting Date", "posting_date", "Date Posted"]
 EXPIRY_DATE_KEYS = ["Expiry Date", "expiry_date", "Expiration Date"]
 FEATURED_KEYS = ["Featured", "is_featured"]
 
+# Job.source for rows created by this command (employer-posted jobs leave it blank)
+IMPORT_SOURCE = "import"
+
 
 def norm(val):
     return (val or "").strip()
 
 
 def pick(row, keys):
+    # First non-blank value; each candidate is looked up and stripped once
     for k in keys:
-        if k in row and norm(row.get(k)):
-            return norm(row.get(k))
+        v = norm(row.get(k))
+        if v:
+            return v
     return ""
 
 
+def _looks_iso(v: str) -> bool:
+    # "YYYY-MM-DD..." (the export format) -- checked without raising
+    return len(v) >= 10 and v[4] == "-" and v[7] == "-" and v[:4].isdigit() and v[5:7].isdigit() and v[8:10].isdigit()
+
+
 def parse_date(val: str) -> Optional[datetime]:
     v = norm(val)
     if not v:
         return None
 
+    # Fast path: fromisoformat is C-level and covers the common export formats in one call
+    if _looks_iso(v):
+        try:
+            return datetime.fromisoformat(v)
+        except ValueError:
+            pass
+
     for fmt in (
         "%Y-%m-%d %H:%M:%S",
         "%Y-%m-%d %H:%M",
@@ -77,17 +97,19 @@ def mode_from_filename(filename: str) -> str:
     return "active"
 
 
+@lru_cache(maxsize=None)
+def _max_lengths(model_cls) -> dict:
+    # Field introspection once per model, not once per row/field
+    return {f.name: f.max_length for f in model_cls._meta.concrete_fields if getattr(f, "max_length", None)}
+
+
 def _truncate_for_model(model_cls, field_name: str, value: str) -> str:
     if value is None:
         return ""
     value = str(value).strip()
-    try:
-        field = model_cls._meta.get_field(field_name)
-        max_len = getattr(field, "max_length", None)
-        if max_len and len(value) > max_len:
-            return value[:max_len]
-    except Exception:
-        pass
+    max_len = _max_lengths(model_cls).get(field_name)
+    if max_len and len(value) > max_len:
+        return value[:max_len]
     return value
 
 
@@ -97,16 +119,26 @@ class Command(BaseCommand):
     def add_arguments(self, parser):
         parser.add_argument("csv_paths", nargs="+", type=str)
         parser.add_argument("--dry-run", action="store_true")
+        parser.add_argument(
+            "--fast",
+            action="store_true",
+            help="Postgres: drop non-unique Job indexes during the load and rebuild them once at the end.",
+        )
 
     def handle(self, *args, **opts):
         csv_paths = opts["csv_paths"]
         dry_run = bool(opts["dry_run"])
+        fast = bool(opts["fast"])
 
         created = 0
         skipped = 0
         missing_employer = 0
         errors = 0
 
+        # Rows are cleaned per-row, then written in one pass (COPY on Postgres); each job keeps its
+        # "<file> row N" label so a failed write can still be traced back to the CSV
+        pending: list[tuple[str, Job]] = []
+
         def abs_path(p: str) -> Path:
             pp = Path(p)
             return pp if pp.is_absolute() else Path(settings.BASE_DIR) / pp
@@ -122,76 +154,109 @@ class Command(BaseCommand):
 
                 self.stdout.write(f"\n--- Importing {path.name} | mode={mode} (is_active={is_active}) ---")
 
-                with path.open(newline="", encoding="utf-8-sig") as f:
-                    reader = csv.DictReader(f)
-
-                    for idx, row in enumerate(reader, start=2):
-                        try:
-                            employer_email = pick(row, EMAIL_KEYS).lower()
-                            title = pick(row, TITLE_KEYS)
-                            description = pick(row, DESC_KEYS)
-
-                            if not employer_email or not title:
-                                skipped += 1
-                                continue
-
-                            employer = Employer.objects.filter(email__iexact=employer_email).first()
-                            if not employer:
-                                missing_employer += 1
-                                continue
-
-                            location = pick(row, LOCATION_KEYS)
-                            if not location:
-                                city = pick(row, CITY_KEYS)
-                                prov = pick(row, PROV_KEYS)
-                                location = ", ".join([p for p in [city, prov] if p])
-
-                            job_type = pick(row, JOB_TYPE_KEYS)
-                            comp_type = pick(row, COMP_TYPE_KEYS)
-                            apply_via = pick(row, APPLY_VIA_KEYS)
-                            apply_email = pick(row, APPLY_EMAIL_KEYS)
-                            apply_url = pick(row, APPLY_URL_KEYS)
-
-                            # ---- TRUNCATE to Job model max_length for CharFields ----
-                            title = _truncate_for_model(Job, "title", title)
-                            location = _truncate_for_model(Job, "location", location)
-                            job_type = _truncate_for_model(Job, "job_type", job_type)
-                            comp_type = _truncate_for_model(Job, "compensation_type", comp_type)
-                            apply_via = _truncate_for_model(Job, "apply_via", apply_via)
-                            apply_email = _truncate_for_model(Job, "apply_email", apply_email)
-                            apply_url = _truncate_for_model(Job, "apply_url", apply_url)
-
-                            job = Job(
-                                employer=employer,
-                                title=title,
-                                description=description,  # TextField: no varchar limit
-                                location=location,
-                                job_type=job_type,
-                                compensation_type=comp_type,
-                                compensation_min=parse_decimal(pick(row, COMP_MIN_KEYS)),
-                                compensation_max=parse_decimal(pick(row, COMP_MAX_KEYS)),
-                                apply_via=apply_via,
-                                apply_email=apply_email,
-                                apply_url=apply_url,
-                                is_active=is_active,
-                                is_featured=pick(row, FEATURED_KEYS).lower() in ("1", "true", "yes"),
-                            )
-
-                            posting_dt = parse_date(pick(row, POSTING_DATE_KEYS))
-                            expiry_dt = parse_date(pick(row, EXPIRY_DATE_KEYS))
-                            if posting_dt:
-                                job.posting_date = posting_dt.date()
-                            if expiry_dt:
-                                job.expiry_date = expiry_dt.date()
-
-                            if not dry_run:
-                                job.save()
-
+                rows = read_csv_rows(path)
+
+                # Pass 1: resolve every employer this file references in one go (not one SELECT per row)
+                employers_by_email = bulk_lookup(
+                    Employer.objects.all(),
+                    "email",
+                    (pick(row, EMAIL_KEYS).lower() for row in rows),
+                )
+
+                for idx, row in enumerate(rows, start=2):
+                    try:
+                        employer_email = pick(row, EMAIL_KEYS).lower()
+                        title = pick(row, TITLE_KEYS)
+                        description = pick(row, DESC_KEYS)
+
+                        if not employer_email or not title:
+                            skipped += 1
+                            continue
+
+                        employer = employers_by_email.get(employer_email)
+                        if not employer:
+                            missing_employer += 1
+                            continue
+
+                        location = pick(row, LOCATION_KEYS)
+                        if not location:
+                            city = pick(row, CITY_KEYS)
+                            prov = pick(row, PROV_KEYS)
+                            location = ", ".join([p for p in [city, prov] if p])
+
+                        job_type = pick(row, JOB_TYPE_KEYS)
+                        comp_type = pick(row, COMP_TYPE_KEYS)
+                        apply_via = pick(row, APPLY_VIA_KEYS)
+                        apply_email = pick(row, APPLY_EMAIL_KEYS)
+                        apply_url = pick(row, APPLY_URL_KEYS)
+
+                        # ---- TRUNCATE to Job model max_length for CharFields ----
+                        title = _truncate_for_model(Job, "title", title)
+                        location = _truncate_for_model(Job, "location", location)
+                        job_type = _truncate_for_model(Job, "job_type", job_type)
+                        comp_type = _truncate_for_model(Job, "compensation_type", comp_type)
+                        apply_via = _truncate_for_model(Job, "apply_via", apply_via)
+                        apply_email = _truncate_for_model(Job, "apply_email", apply_email)
+                        apply_url = _truncate_for_model(Job, "apply_url", apply_url)
+
+                        # Categorical columns repeat a handful of values across thousands of pending rows:
+                        # share one str object per value instead of a fresh copy per row
+                        location = sys.intern(location)
+                        job_type = sys.intern(job_type)
+                        comp_type = sys.intern(comp_type)
+                        apply_via = sys.intern(apply_via)
+
+                        job = Job(
+                            employer=employer,
+                            title=title,
+                            description=description,  # TextField: no varchar limit
+                            location=location,
+                            job_type=job_type,
+                            compensation_type=comp_type,
+                            compensation_min=parse_decimal(pick(row, COMP_MIN_KEYS)),
+                            compensation_max=parse_decimal(pick(row, COMP_MAX_KEYS)),
+                            apply_via=apply_via,
+                            apply_email=apply_email,
+                            apply_url=apply_url,
+                            is_active=is_active,
+                            is_featured=pick(row, FEATURED_KEYS).lower() in ("1", "true", "yes"),
+                            source=IMPORT_SOURCE,
+                        )
+
+                        posting_dt = parse_date(pick(row, POSTING_DATE_KEYS))
+                        expiry_dt = parse_date(pick(row, EXPIRY_DATE_KEYS))
+                        if posting_dt:
+                            job.posting_date = posting_dt.date()
+                        if expiry_dt:
+                            job.expiry_date = expiry_dt.date()
+                        # copy_insert skips Job.save(), which normally derives the flag from the date
+                        job.is_currently_active = not job.is_expired
+
+                        if dry_run:
                             created += 1
-
-                        except Exception as e:
-                            errors += 1
-                            self.stderr.write(f"[Row {idx}] ERROR: {e}")
+                        else:
+                            pending.append((f"{path.name} row {idx}", job))
+
+                    except Exception as e:
+                        errors += 1
+                        self.stderr.write(f"[Row {idx}] ERROR: {e}")
+
+            if pending:
+                with deferred_indexes(Job) if fast else nullcontext():
+                    try:
+                        with transaction.atomic():
+                            created = copy_insert(Job, [job for _, job in pending])
+                    except Exception:
+                        # One bad row aborts the whole COPY: redo the load row by row so only the bad
+                        # rows are reported and everything else still goes in
+                        created = 0
+                        for label, job in pending:
+                            try:
+                                with transaction.atomic():
+                                    created += copy_insert(Job, [job])
+                            except Exception as e:
+                                errors += 1
+                                self.stderr.write(f"[{label}] ERROR: {e}")
 
             if dry_run:
                 transaction.set_rollback(True)
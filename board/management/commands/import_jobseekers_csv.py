@@ -1,4 +1,4 @@
-import csv
+import sys
 from pathlib import Path
 
 from django.conf import settings
@@ -7,6 +7,7 @@ from django.core.management.base import BaseCommand
 from django.db import transaction
 from django.utils import timezone
 
+from board.management.bulk import bulk_create_users, bulk_lookup, read_csv_rows
 from board.models import JobSeeker
 
 User = get_user_model()
@@ -32,9 +33,11 @@ RELOCATE_WHERE_KEYS = ["relocate_where", "Relocate Where", "Relocation Where", "
 
 
 def pick(row, keys):
+    # First non-blank value; each candidate is looked up and stripped once
     for k in keys:
-        if k in row and norm(row.get(k)):
-            return norm(row.get(k))
+        v = norm(row.get(k))
+        if v:
+            return v
     return ""
 
 
@@ -104,80 +107,104 @@ class Command(BaseCommand):
                     )
                 )
 
-                with path.open(newline="", encoding="utf-8-sig") as f:
-                    reader = csv.DictReader(f)
-
-                    for idx, row in enumerate(reader, start=2):
-                        try:
-                            email = pick(row, EMAIL_KEYS).lower()
-                            if not email:
-                                skipped += 1
-                                continue
-
-                            # DRY RUN: do NOT write anything (no get_or_create), just count
-                            if dry_run:
-                                user_exists = User.objects.filter(email=email).exists()
-                                js_exists = JobSeeker.objects.filter(email=email).exists()
-
-                                if user_exists:
-                                    users_existing += 1
-                                else:
-                                    users_created += 1  # would create
-
-                                if js_exists:
-                                    js_updated += 1  # would update
-                                else:
-                                    js_created += 1  # would create
-
-                                continue
-
-                            # REAL RUN: create/update user
-                            user = User.objects.filter(email=email).first()
-                            if not user:
-                                user = User.objects.create_user(
-                                    username=email,
-                                    email=email,
-                                    password=None,
-                                    is_active=login_active,
-                                )
-                                users_created += 1
-                            else:
+                rows = read_csv_rows(path)
+
+                # Pass 1: fetch existing users/jobseekers for the whole file in a few IN queries
+                # (dry-run only needs to know which emails exist, so it loads just that column)
+                emails = [pick(row, EMAIL_KEYS).lower() for row in rows]
+                users_qs = User.objects.order_by("pk")
+                seekers_qs = JobSeeker.objects.order_by("pk")
+                if dry_run:
+                    users_qs = users_qs.only("email")
+                    seekers_qs = seekers_qs.only("email")
+                users_by_email = bulk_lookup(users_qs, "email", emails)
+                seekers_by_email = bulk_lookup(seekers_qs, "email", emails)
+
+                # REAL RUN: create every missing user in batched INSERTs, then pick them up with the same lookup
+                new_user_emails = set()
+                if not dry_run:
+                    new_user_emails = {e for e in emails if e and e not in users_by_email}
+                    if new_user_emails:
+                        bulk_create_users(sorted(new_user_emails), is_active=login_active)
+                        users_by_email.update(bulk_lookup(User.objects.order_by("pk"), "email", new_user_emails))
+
+                for idx, row in enumerate(rows, start=2):
+                    try:
+                        email = pick(row, EMAIL_KEYS).lower()
+                        if not email:
+                            skipped += 1
+                            continue
+
+                        # DRY RUN: do NOT write anything (no get_or_create), just count
+                        if dry_run:
+                            user_exists = email in users_by_email
+                            js_exists = email in seekers_by_email
+
+                            if user_exists:
                                 users_existing += 1
-                                if user.is_active != login_active:
-                                    user.is_active = login_active
-                                    user.save(update_fields=["is_active"])
-                                    users_updated += 1
-
-                            # REAL RUN: create/update jobseeker (user_id must never be null)
-                            js, created = JobSeeker.objects.get_or_create(
-                                email=email,
-                                defaults={"user": user},
-                            )
-
-                            if js.user_id != user.id:
-                                js.user = user
-
-                            js.first_name = truncate(pick(row, FIRST_NAME_KEYS), 80)
-                            js.last_name = truncate(pick(row, LAST_NAME_KEYS), 80)
-                            js.position_desired = truncate(pick(row, POSITION_KEYS), 200)
-                            js.opportunity_type = truncate(pick(row, OPPORTUNITY_KEYS), 30)
-                            js.current_location = truncate(pick(row, LOCATION_KEYS), 200)
-                            js.relocate_where = truncate(pick(row, RELOCATE_WHERE_KEYS), 200)
-
-                            js.is_approved = is_approved
-                            js.login_active = login_active
-                            js.approved_at = timezone.now() if is_approved else None
-
-                            js.save()
+                            else:
+                                users_created += 1  # would create
 
-                            if created:
-                                js_created += 1
+                            if js_exists:
+                                js_updated += 1  # would update
                             else:
-                                js_updated += 1
+                                js_created += 1  # would create
 
-                        except Exception as e:
-                            errors += 1
-                            self.stderr.write(f"[Row {idx}] ERROR: {e}")
+                            continue
+
+                        # REAL RUN: create/update user
+                        user = users_by_email.get(email)
+                        if not user:
+                            user = User.objects.create_user(
+                                username=email,
+                                email=email,
+                                password=None,
+                                is_active=login_active,
+                            )
+                            users_by_email[email] = user
+                            users_created += 1
+                        elif email in new_user_emails:
+                            new_user_emails.discard(email)
+                            users_created += 1
+                        else:
+                            users_existing += 1
+                            if user.is_active != login_active:
+                                user.is_active = login_active
+                                user.save(update_fields=["is_active"])
+                                users_updated += 1
+
+                        # REAL RUN: create/update jobseeker (user_id must never be null)
+                        js = seekers_by_email.get(email)
+                        created = js is None
+                        if created:
+                            js = JobSeeker.objects.create(email=email, user=user)
+                            seekers_by_email[email] = js
+
+                        if js.user_id != user.id:
+                            js.user = user
+
+                        js.first_name = truncate(pick(row, FIRST_NAME_KEYS), 80)
+                        js.last_name = truncate(pick(row, LAST_NAME_KEYS), 80)
+                        js.position_desired = truncate(pick(row, POSITION_KEYS), 200)
+                        # Low-cardinality columns: one shared str per value across all cached JobSeekers
+                        js.opportunity_type = sys.intern(truncate(pick(row, OPPORTUNITY_KEYS), 30))
+                        js.current_location = sys.intern(truncate(pick(row, LOCATION_KEYS), 200))
+                        js.relocate_where = truncate(pick(row, RELOCATE_WHERE_KEYS), 200)
+
+                        js.is_approved = is_approved
+                        js.login_active = login_active
+                        js.approved_at = timezone.now() if is_approved else None
+
+                        js.save()
+
+                        if created:
+                            js_created += 1
+                        else:
+                            js_updated += 1
+
+                    except Exception as e:
+                        errors += 1
+                        self.stderr.write(f"[Row {idx}] ERROR: {e}")
 
             # Dry-run rollback safety (no writes should have happened anyway)
             if dry_run:
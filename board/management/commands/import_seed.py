@@ -1,5 +1,7 @@
 from django.core.management.base import BaseCommand
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
+from django.db import transaction
 from board.models import PostingPackage, Employer, Job, JobSeeker
 from datetime import date, timedelta
 
@@ -10,92 +12,101 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         self.stdout.write(self.style.WARNING("Seeding test data…"))
 
-        # --- Posting Packages ---
-        PostingPackage.objects.all().delete()
-        pkg1 = PostingPackage.objects.create(
-            code="basic-30",
-            name="Basic 30-day Posting",
-            description="1 job posting, active for 30 days.",
-            price_cents=5000,
-            duration_days=30,
-            max_jobs=1,
-            is_featured_package=False,
-            is_active=True,
-            order=1,
-        )
-        pkg2 = PostingPackage.objects.create(
-            code="featured-60",
-            name="Featured 60-day Posting",
-            description="Highlight your job for 60 days.",
-            price_cents=12000,
-            duration_days=60,
-            max_jobs=3,
-            is_featured_package=True,
-            is_active=True,
-            order=2,
-        )
-        self.stdout.write(self.style.SUCCESS("Created packages"))
+        # One transaction for the whole seed (one COMMIT instead of one per INSERT)
+        with transaction.atomic():
+            # --- Posting Packages ---
+            PostingPackage.objects.all().delete()
+            pkg1, pkg2 = PostingPackage.objects.bulk_create(
+                [
+                    PostingPackage(
+                        code="basic-30",
+                        name="Basic 30-day Posting",
+                        description="1 job posting, active for 30 days.",
+                        price_cents=5000,
+                        duration_days=30,
+                        credits=1,
+                        allows_featured=False,
+                        is_active=True,
+                        order=1,
+                    ),
+                    PostingPackage(
+                        code="featured-60",
+                        name="Featured 60-day Posting",
+                        description="Highlight your job for 60 days.",
+                        price_cents=12000,
+                        duration_days=60,
+                        credits=3,
+                        allows_featured=True,
+                        is_active=True,
+                        order=2,
+                    ),
+                ]
+            )
+            PostingPackage.objects.clear_active_list()
+            self.stdout.write(self.style.SUCCESS("Created packages"))
 
-        # --- Employer ---
-        Employer.objects.all().delete()
-        user_emp = User.objects.create_user(
-            username="employer1",
-            email="employer1@example.com",
-            password="test1234",
-        )
-        employer = Employer.objects.create(
-            user=user_emp,
-            email="employer1@example.com",
-            name="Jane Doe",
-            company_name="Physio Clinic Inc.",
-            location="Toronto, ON",
-            is_approved=True,
-            posting_package=pkg2,
-            credits_total=3,
-            credits_used=0,
-        )
-        self.stdout.write(self.style.SUCCESS("Created employer"))
+            # --- Users (hash the shared test password once) ---
+            User.objects.filter(username__in=["employer1", "jobseeker1"]).delete()
+            password = make_password("test1234")
+            User.objects.bulk_create(
+                [
+                    User(username="employer1", email="employer1@example.com", password=password),
+                    User(username="jobseeker1", email="jobseeker1@example.com", password=password),
+                ]
+            )
+            users = User.objects.in_bulk(["employer1", "jobseeker1"], field_name="username")
+            user_emp = users["employer1"]
+            user_js = users["jobseeker1"]
 
-        # --- Job ---
-        Job.objects.all().delete()
-        job = Job.objects.create(
-            employer=employer,
-            title="Physiotherapist",
-            description="Join our busy clinic and help patients recover!",
-            location="Toronto, ON",
-            compensation_type="hourly",
-            salary_min=35,
-            salary_max=50,
-            job_type="full_time",
-            relocation_assistance=True,
-            posting_date=date.today(),
-            expiry_date=date.today() + timedelta(days=30),
-            featured=True,
-            is_active=True,
-        )
-        self.stdout.write(self.style.SUCCESS("Created job"))
+            # --- Employer ---
+            Employer.objects.all().delete()
+            employer = Employer.objects.create(
+                user=user_emp,
+                email="employer1@example.com",
+                name="Jane Doe",
+                company_name="Physio Clinic Inc.",
+                location="Toronto, ON",
+                is_approved=True,
+                credits=pkg2.credits,
+            )
+            self.stdout.write(self.style.SUCCESS("Created employer"))
 
-        # --- JobSeeker ---
-        JobSeeker.objects.all().delete()
-        user_js = User.objects.create_user(
-            username="jobseeker1",
-            email="jobseeker1@example.com",
-            password="test1234",
-        )
-        seeker = JobSeeker.objects.create(
-            user=user_js,
-            email="jobseeker1@example.com",
-            first_name="John",
-            last_name="Smith",
-            registration_status="yes",
-            opportunity_type="full_time",
-            current_location="Vancouver, BC",
-            open_to_relocation=True,
-            relocation_where="Toronto, ON",
-            need_sponsorship=False,
-            seeking_immigration=False,
-            is_approved=True,
-        )
-        self.stdout.write(self.style.SUCCESS("Created jobseeker"))
+            # --- Job ---
+            Job.objects.all().delete()
+            Job.objects.create(
+                employer=employer,
+                title="Physiotherapist",
+                description="Join our busy clinic and help patients recover!",
+                location="Toronto, ON",
+                compensation_type="hourly",
+                compensation_min=35,
+                compensation_max=50,
+                job_type="full_time",
+                relocation_assistance=True,
+                posting_date=date.today(),
+                expiry_date=date.today() + timedelta(days=30),
+                is_featured=True,
+                featured=True,
+                is_active=True,
+            )
+            self.stdout.write(self.style.SUCCESS("Created job"))
+
+            # --- JobSeeker ---
+            JobSeeker.objects.all().delete()
+            JobSeeker.objects.create(
+                user=user_js,
+                email="jobseeker1@example.com",
+                first_name="John",
+                last_name="Smith",
+                registered_in_canada=True,
+                opportunity_type="full_time",
+                current_location="Vancouver, BC",
+                open_to_relocate=True,
+                relocate_where="Toronto, ON",
+                require_sponsorship=False,
+                seeking_immigration=False,
+                is_approved=True,
+            )
+            self.stdout.write(self.style.SUCCESS("Created jobseeker"))
 
         self.stdout.write(self.style.SUCCESS("✅ Database seeding complete!"))
@@ -1,14 +1,45 @@
 # board/management/commands/repair_dates.py
 from __future__ import annotations
 
-import re
+from contextlib import contextmanager, nullcontext
+from itertools import groupby
+from operator import itemgetter
 from typing import List, Tuple
 
 from django.core.management.base import BaseCommand
-from django.db import connection
-
-
-TYPE_RE = re.compile(r"(date|time|stamp)", re.IGNORECASE)
+from django.db import connection, transaction
+
+
+# Whole repair plan in one round trip: every board_* table joined to its DATE/DATETIME/TIMESTAMP columns
+# (case-insensitive match on the declared type). LEFT JOIN keeps tables without any, as a NULL column.
+REPAIR_PLAN_SQL = """
+    SELECT m.name, p.name, p.type
+    FROM sqlite_master AS m
+    LEFT JOIN pragma_table_info(m.name) AS p
+      ON lower(p.type) GLOB '*date*' OR lower(p.type) GLOB '*time*' OR lower(p.type) GLOB '*stamp*'
+    WHERE m.type = 'table' AND m.name LIKE 'board_%'
+    ORDER BY m.name, p.cid;
+"""
+
+# Connection tuning for the bulk rewrite (fewer fsyncs, temp B-trees in RAM); restored afterwards
+BULK_PRAGMAS = {"journal_mode": "WAL", "synchronous": "NORMAL", "temp_store": "MEMORY"}
+
+
+@contextmanager
+def _bulk_pragmas():
+    # journal_mode can't change inside a transaction, so this wraps the atomic block rather than sitting in it
+    with connection.cursor() as cur:
+        previous = {}
+        for name, value in BULK_PRAGMAS.items():
+            cur.execute(f"PRAGMA {name};")
+            previous[name] = cur.fetchone()[0]
+            cur.execute(f"PRAGMA {name} = {value};")
+    try:
+        yield
+    finally:
+        with connection.cursor() as cur:
+            for name, value in previous.items():
+                cur.execute(f"PRAGMA {name} = {value};")
 
 
 class Command(BaseCommand):
@@ -43,76 +74,97 @@ class Command(BaseCommand):
         default = opts["default"]
         dry_run = opts["dry_run"]
 
-        with connection.cursor() as cur:
-            # 1) discover tables
-            cur.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name LIKE 'board_%';"
-            )
-            tables = [row[0] for row in cur.fetchall()]
+        # Fallback expression per column kind, resolved once per run (not per table/column)
+        fallbacks = (
+            {"datetime": "CURRENT_TIMESTAMP", "date": "DATE('now')"}
+            if default == "now"
+            else {"datetime": "NULL", "date": "NULL"}
+        )
+
+        # All tables repaired in one transaction: SQLite commits (and fsyncs) once.
+        # Dry-run writes nothing, so it needs neither the pragmas nor the transaction.
+        with (
+            nullcontext() if dry_run else _bulk_pragmas(),
+            nullcontext() if dry_run else transaction.atomic(),
+            connection.cursor() as cur,
+        ):
+            # 1) discover tables and their date/time-ish columns (pragma_table_info is table-valued, SQLite >= 3.16)
+            cur.execute(REPAIR_PLAN_SQL)
+            plan: List[Tuple[str, List[Tuple[str, str]]]] = [
+                (
+                    table,
+                    # classify by presence of 'time' in type string: if it has 'time' then treat as datetime
+                    [
+                        (name, "datetime" if "time" in decl_type.lower() else "date")
+                        for _, name, decl_type in rows
+                        if name is not None
+                    ],
+                )
+                for table, rows in groupby(cur.fetchall(), key=itemgetter(0))
+            ]
 
             total_updates = 0
             total_skipped = 0
+            total_clean = 0
             total_errors = 0
 
-            for table in tables:
-                # 2) discover date/time-ish columns on this table
-                try:
-                    cur.execute(f"PRAGMA table_info({table});")
-                    cols: List[Tuple[int, str, str, int, str, int]] = cur.fetchall()
-                    # PRAGMA table_info returns: cid, name, type, notnull, dflt_value, pk
-                except Exception as exc:
-                    self.stderr.write(self.style.ERROR(f"{table}: cannot introspect -> {exc}"))
-                    total_errors += 1
-                    continue
-
-                dt_cols = []
-                for _, name, decl_type, *_ in cols:
-                    decl_type = decl_type or ""
-                    if TYPE_RE.search(decl_type):
-                        # classify by presence of 'time' in type string: if it has 'time' then treat as datetime
-                        kind = "datetime" if re.search(r"time", decl_type, re.IGNORECASE) else "date"
-                        dt_cols.append((name, kind))
-
+            for table, dt_cols in plan:
+                # 2) tables with nothing to repair never get a statement
                 if not dt_cols:
                     total_skipped += 1
                     self.stdout.write(self.style.WARNING(f"{table}: no DATE/TIME columns declared; skip"))
                     continue
 
-                # 3) build and execute updates per column
+                # 3) one UPDATE per table: every date column is repaired in the same scan
+                set_clauses = []
+                bad_conds = []
                 for col, kind in dt_cols:
-                    set_expr = (
-                        ("CURRENT_TIMESTAMP" if kind == "datetime" else "DATE('now')")
-                        if default == "now"
-                        else "NULL"
-                    )
-                    where = f"(typeof({col}) <> 'text' OR {col} = '')"
-                    sql = f"UPDATE {table} SET {col} = {set_expr} WHERE {where};"
+                    bad = f"(typeof({col}) <> 'text' OR {col} = '')"
+                    set_clauses.append(f"{col} = CASE WHEN {bad} THEN {fallbacks[kind]} ELSE {col} END")
+                    bad_conds.append(bad)
 
-                    if dry_run:
-                        self.stdout.write(self.style.WARNING(f"[DRY-RUN] {sql}"))
-                        continue
+                where = " OR ".join(bad_conds)
+
+                # Read-only probe first: in steady state nothing is malformed, and a SELECT ... LIMIT 1
+                # avoids taking the write lock / touching the journal for an UPDATE that matches 0 rows
+                cur.execute(f"SELECT 1 FROM {table} WHERE {where} LIMIT 1;")
+                if cur.fetchone() is None:
+                    total_clean += 1
+                    continue
+
+                sql = f"UPDATE {table} SET {', '.join(set_clauses)} WHERE {where};"
+
+                if dry_run:
+                    self.stdout.write(self.style.WARNING(f"[DRY-RUN] {sql}"))
+                    continue
 
-                    try:
+                try:
+                    # savepoint per table: a failing table doesn't poison the outer transaction
+                    with transaction.atomic():
                         cur.execute(sql)
-                        count = cur.rowcount or 0
-                        total_updates += count
-                        if count:
-                            self.stdout.write(
-                                self.style.SUCCESS(f"{table}.{col}: {count} row(s) repaired.")
-                            )
-                    except Exception as exc:
-                        total_errors += 1
-                        self.stderr.write(
-                            self.style.ERROR(f"{table}.{col}: failed\n  {sql}\n  -> {exc}")
+                    count = cur.rowcount or 0
+                    total_updates += count
+                    if count:
+                        cols_label = ", ".join(col for col, _ in dt_cols)
+                        self.stdout.write(
+                            self.style.SUCCESS(f"{table} ({cols_label}): {count} row(s) repaired.")
                         )
+                except Exception as exc:
+                    total_errors += 1
+                    self.stderr.write(
+                        self.style.ERROR(f"{table}: failed\n  {sql}\n  -> {exc}")
+                    )
 
         if dry_run:
-            self.stdout.write(self.style.SUCCESS("Dry-run complete. No changes written."))
+            self.stdout.write(
+                self.style.SUCCESS(f"Dry-run complete. No changes written. Tables already clean: {total_clean}")
+            )
         else:
             self.stdout.write(
                 self.style.SUCCESS(
                     f"Done. Total rows repaired: {total_updates}; "
                     f"tables without date/time columns skipped: {total_skipped}; "
+                    f"tables already clean: {total_clean}; "
                     f"errors: {total_errors}"
                 )
             )
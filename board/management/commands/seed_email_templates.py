@@ -1,137 +1,21 @@
+import json
+from pathlib import Path
+
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from board.models import EmailTemplate
 
 # NOTE:
 # - Keep tokens SIMPLE: {{ job_title }}, {{ package_name }}, {{ email }}, {{ site_name }}, etc.
 # - This matches your views.py send_templated_email() which does simple string replacement.
 
-# key, subject, html
-TEMPLATES = [
-    # ============================================================
-    # Admin notifications (signup + approval)
-    # ============================================================
-    (
-        "admin_new_employer",
-        "Admin: New Employer Signup",
-        "<p>A new employer signed up: <strong>{{ email }}</strong></p>",
-    ),
-    (
-        "admin_new_jobseeker",
-        "Admin: New Job Seeker Signup",
-        "<p>A new job seeker signed up: <strong>{{ email }}</strong></p>",
-    ),
-    (
-        "employer_approved",
-        "Your Employer Account Has Been Approved",
-        "<p>Hi {{ email }},</p>"
-        "<p>Your employer account has been approved. You can now log in and post jobs.</p>"
-        "<p>Log in: {{ login_url }}</p>",
-    ),
-    (
-        "jobseeker_approved",
-        "Your Job Seeker Account Has Been Approved",
-        "<p>Hi {{ email }},</p>"
-        "<p>Your job seeker account has been approved. You can now log in and apply to jobs.</p>"
-        "<p>Log in: {{ login_url }}</p>",
-    ),
-
-    # ============================================================
-    # Your required list (using SIMPLE tokens)
-    # ============================================================
-    (
-        "application_email_to_employer",
-        "New Application Received: {{ job_title }}",
-        "<p>You received a new application for: <strong>{{ job_title }}</strong></p>"
-        "<p>Employer: {{ employer_name }}</p>"
-        "<p>View applications in your dashboard: {{ dashboard_url }}</p>",
-    ),
-    (
-        "email_verification",
-        "Verify Your Email",
-        "<p>Please verify your email address by clicking this link:</p>"
-        "<p>{{ verify_url }}</p>",
-    ),
-    (
-        "employer_welcome",
-        "Employer Signup Received",
-        "<p>Hi {{ email }},</p>"
-        "<p>Thanks for signing up. Your employer account is pending admin approval.</p>"
-        "<p>You will receive an email once your account is approved.</p>",
-    ),
-    (
-        "job_alert",
-        "Job Alert: New opportunities available",
-        "<p>New physiotherapy jobs matching your alert are available.</p>"
-        "<p>Browse: {{ jobs_url }}</p>",
-    ),
-    (
-        "job_expiration_notice",
-        "Job Expiration Notice: {{ job_title }}",
-        "<p>Your job posting <strong>{{ job_title }}</strong> is expiring soon.</p>"
-        "<p>Manage your jobs here: {{ dashboard_url }}</p>",
-    ),
-    (
-        "job_posting_confirmation",
-        "Job Posting Confirmation: {{ job_title }}",
-        "<p>Your job <strong>{{ job_title }}</strong> has been posted.</p>"
-        "<p>View it here: {{ job_url }}</p>",
-    ),
-    (
-        "jobseeker_application_confirmation",
-        "Application Confirmation: {{ job_title }}",
-        "<p>Thanks for applying to <strong>{{ job_title }}</strong>.</p>"
-        "<p>You can review your applications here: {{ dashboard_url }}</p>",
-    ),
-    (
-        "jobseeker_welcome",
-        "Job Seeker Signup Received",
-        "<p>Hi {{ email }},</p>"
-        "<p>Thanks for signing up. Your account is pending admin approval.</p>"
-        "<p>You will receive an email once your account is approved.</p>",
-    ),
-    (
-        "order_confirmation",
-        "Order Confirmation: {{ package_name }}",
-        "<p>Thanks for your purchase of <strong>{{ package_name }}</strong>.</p>"
-        "<p>Amount: {{ amount }}</p>"
-        "<p>Your posting credits will be available in your dashboard.</p>",
-    ),
-    (
-        "password_recovery",
-        "Password Recovery",
-        "<p>Reset your password using the link below:</p>"
-        "<p>{{ reset_url }}</p>",
-    ),
-    (
-        "product_expiration_notice",
-        "Package Expiration Notice: {{ package_name }}",
-        "<p>Your posting package <strong>{{ package_name }}</strong> is expiring soon.</p>"
-        "<p>Manage packages: {{ dashboard_url }}</p>",
-    ),
-    (
-        "recurring_payment_failed",
-        "Recurring Payment Failed",
-        "<p>Your recurring payment failed.</p>"
-        "<p>Please update your payment method.</p>",
-    ),
-    (
-        "recurring_subscription_canceled",
-        "Recurring Subscription Canceled",
-        "<p>Your recurring subscription has been canceled.</p>",
-    ),
-    (
-        "resume_expiration_notice",
-        "Resume Expiration Notice",
-        "<p>One of your resumes is expiring soon.</p>"
-        "<p>Manage resumes: {{ dashboard_url }}</p>",
-    ),
-    (
-        "resume_posting_confirmation",
-        "Resume Posting Confirmation",
-        "<p>Your resume has been posted.</p>"
-        "<p>Manage resumes: {{ dashboard_url }}</p>",
-    ),
-]
+# key, subject, html -- kept in email_templates.json next to this file and only read when the command runs
+TEMPLATES_PATH = Path(__file__).with_name("email_templates.json")
+
+
+def load_templates() -> list[tuple[str, str, str]]:
+    with TEMPLATES_PATH.open(encoding="utf-8") as f:
+        return [(t["key"], t["subject"], t["html"]) for t in json.load(f)]
 
 
 class Command(BaseCommand):
@@ -146,30 +30,27 @@ class Command(BaseCommand):
 
     def handle(self, *args, **kwargs):
         force = bool(kwargs.get("force"))
-        created = 0
-        updated = 0
+        templates = load_templates()
 
-        for key, subject, html in TEMPLATES:
-            obj, was_created = EmailTemplate.objects.get_or_create(
-                key=key,
-                defaults={"subject": subject, "html": html, "is_enabled": True},
-            )
-            if was_created:
-                created += 1
+        # One SELECT for all existing rows, then one INSERT batch + one UPDATE batch (not 2 queries per template)
+        existing = EmailTemplate.objects.in_bulk([key for key, _, _ in templates], field_name="key")
+        to_create = []
+        to_update = []
+
+        for key, subject, html in templates:
+            obj = existing.get(key)
+            if obj is None:
+                to_create.append(EmailTemplate(key=key, subject=subject, html=html, is_enabled=True))
                 continue
 
             # Existing template: default is SAFE upsert (do not overwrite admin edits)
             changed = False
 
             if force:
-                if obj.subject != subject:
-                    obj.subject = subject
-                    changed = True
-                if obj.html != html:
-                    obj.html = html
-                    changed = True
-                if obj.is_enabled is False:
-                    obj.is_enabled = True
+                # One tuple compare; rows already matching the seed are never rewritten
+                desired = (subject, html, True)
+                if (obj.subject, obj.html, obj.is_enabled) != desired:
+                    obj.subject, obj.html, obj.is_enabled = desired
                     changed = True
             else:
                 # Only fill blanks safely
@@ -184,8 +65,17 @@ class Command(BaseCommand):
                     changed = True
 
             if changed:
-                obj.save(update_fields=["subject", "html", "is_enabled"])
-                updated += 1
+                to_update.append(obj)
+
+        with transaction.atomic():
+            if to_create:
+                # ignore_conflicts: a row created concurrently since the SELECT is left alone, like get_or_create
+                EmailTemplate.objects.bulk_create(to_create, ignore_conflicts=True)
+            if to_update:
+                EmailTemplate.objects.bulk_update(to_update, ["subject", "html", "is_enabled"])
+
+        created = len(to_create)
+        updated = len(to_update)
 
         self.stdout.write(
             self.style.SUCCESS(
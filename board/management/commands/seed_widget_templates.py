@@ -4,7 +4,7 @@ from board.models import WidgetTemplate
 WIDGETS = [
     {
         "slug": "recent_jobs_embed",
-        "title": "Recent Jobs (Embeddable)",
+        "name": "Recent Jobs (Embeddable)",
         "html": """<iframe src="https://YOUR_DOMAIN/embed/recent-jobs" style="width:100%;height:520px;border:0;" loading="lazy" referrerpolicy="no-referrer-when-downgrade"></iframe>""",
     }
 ]
@@ -15,10 +15,18 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         created, updated = 0, 0
         for w in WIDGETS:
-            obj, was_created = WidgetTemplate.objects.update_or_create(
+            obj, was_created = WidgetTemplate.objects.get_or_create(
                 slug=w["slug"],
-                defaults={"title": w["title"], "html": w["html"]},
+                defaults={"name": w["name"], "html": w["html"]},
             )
-            created += 1 if was_created else 0
-            updated += 0 if was_created else 1
+            if was_created:
+                created += 1
+                continue
+
+            # Only write when something actually differs (re-runs are otherwise read-only)
+            if obj.name != w["name"] or obj.html != w["html"]:
+                obj.name = w["name"]
+                obj.html = w["html"]
+                obj.save(update_fields=["name", "html"])
+                updated += 1
         self.stdout.write(self.style.SUCCESS(f"WidgetTemplates — created: {created}, updated: {updated}"))
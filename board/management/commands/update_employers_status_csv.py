@@ -3,33 +3,99 @@ import csv
 from typing import Optional
 
 from django.core.management.base import BaseCommand
-from django.db import transaction
+from django.db import connection, transaction
 
+from board.management.bulk import bulk_lookup
 from board.models import Employer
 
 
-EMAIL_KEYS = [
+EMAIL_KEYS = (
     "email",
     "Email",
     "Employer Email",
     "employer_email",
     "EmployerEmail",
-]
+)
+
+
+UPDATE_BATCH_SIZE = 500
 
 
 def pick_email_key(fieldnames: list[str] | None) -> Optional[str]:
     if not fieldnames:
         return None
-    for k in EMAIL_KEYS:
-        if k in fieldnames:
-            return k
-    return None
+    # Membership test against a set of the header, in EMAIL_KEYS priority order
+    present = set(fieldnames)
+    return next((k for k in EMAIL_KEYS if k in present), None)
 
 
 def normalize_email(val: str) -> str:
     return (val or "").strip().lower()
 
 
+# Matching rule shared by every path: an email selects ONE employer, the one with the lowest id
+# (like filter(email=...).order_by("id").first()); it is changed only if it isn't already inactive.
+# _plan() applies it in Python; the Postgres paths below apply it in SQL with DISTINCT ON.
+def _first_match_sql(source: str) -> str:
+    table = connection.ops.quote_name(Employer._meta.db_table)
+    return (
+        f"SELECT DISTINCT ON (emp.email) emp.id, emp.is_approved, emp.login_active "
+        f"FROM {source} JOIN {table} AS emp ON emp.email = t.e "
+        f"ORDER BY emp.email, emp.id"
+    )
+
+
+def _apply_via_temp_table(emails: list[str], is_approved: bool, login_active: bool) -> Optional[int]:
+    """
+    Postgres fast path for large lists: COPY the distinct emails into a temp table and set the status
+    with a single UPDATE ... FROM join (no giant IN list; emails are stored lowercase, so idx_employer_email serves it).
+    Returns the number of employers changed, or None when not on Postgres/psycopg 3.
+    Must run inside transaction.atomic(): the temp table is dropped on commit. IF NOT EXISTS + TRUNCATE
+    lets the command run more than once inside one outer transaction (e.g. call_command from a wrapper).
+    """
+    if connection.vendor != "postgresql":
+        return None
+
+    with connection.cursor() as cur:
+        raw = getattr(cur, "cursor", None)
+        if not hasattr(raw, "copy"):
+            return None
+
+        cur.execute("CREATE TEMP TABLE IF NOT EXISTS _status_emails (e text PRIMARY KEY) ON COMMIT DROP")
+        cur.execute("TRUNCATE _status_emails")
+        with raw.copy("COPY _status_emails (e) FROM STDIN") as copy:
+            for email in sorted({e for e in emails if e}):
+                copy.write_row((email,))
+
+        table = connection.ops.quote_name(Employer._meta.db_table)
+        cur.execute(
+            f"WITH first AS ({_first_match_sql('_status_emails AS t')}) "
+            f"UPDATE {table} AS emp SET is_approved = %s, login_active = %s "
+            f"FROM first "
+            f"WHERE emp.id = first.id AND (first.is_approved <> %s OR first.login_active <> %s)",
+            [is_approved, login_active, is_approved, login_active],
+        )
+        return cur.rowcount
+
+
+def _count_via_sql(emails: list[str], is_approved: bool, login_active: bool) -> Optional[int]:
+    """
+    Postgres dry-run: count the employers a real run would change with one query over
+    unnest(<email array>) -- no Python join loop, no temp table, no transaction.
+    Returns None when not on Postgres.
+    """
+    if connection.vendor != "postgresql":
+        return None
+
+    with connection.cursor() as cur:
+        cur.execute(
+            f"SELECT COUNT(*) FROM ({_first_match_sql('unnest(%s::text[]) AS t(e)')}) AS first "
+            f"WHERE first.is_approved <> %s OR first.login_active <> %s",
+            [sorted({e for e in emails if e}), is_approved, login_active],
+        )
+        return cur.fetchone()[0]
+
+
 class Command(BaseCommand):
     help = "Mark employers from CSV as inactive (pending or deactivated legacy lists)."
 
@@ -48,64 +114,119 @@ class Command(BaseCommand):
         kind: str = opts["kind"]
         dry_run: bool = opts["dry_run"]
 
-        updated = 0
-        skipped = 0
-        errors = 0
-
         # CONTRACT RULE:
         # pending + deactivated => NOT approved, login blocked
         target_is_approved = False
         target_login_active = False
 
         with open(csv_path, newline="", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            email_key = pick_email_key(reader.fieldnames)
+            # Only the email column is used: plain csv.reader + one header lookup, no dict per row
+            reader = csv.reader(f)
+            headers = next(reader, [])
+            email_key = pick_email_key(headers)
 
             if not email_key:
                 raise ValueError(
-                    f"CSV must include an email column. Found headers: {reader.fieldnames}"
+                    f"CSV must include an email column. Found headers: {headers}"
                 )
 
-            for idx, row in enumerate(reader, start=2):
-                try:
-                    email = normalize_email(row.get(email_key, ""))
-                    if not email:
-                        skipped += 1
-                        continue
-
-                    emp = Employer.objects.filter(email__iexact=email).first()
-                    if not emp:
-                        skipped += 1
-                        continue
-
-                    # already inactive → skip
-                    if (
-                        emp.is_approved is False
-                        and emp.login_active is False
-                    ):
-                        skipped += 1
-                        continue
-
-                    if dry_run:
-                        updated += 1
-                        continue
-
-                    with transaction.atomic():
-                        emp.is_approved = target_is_approved
-                        emp.login_active = target_login_active
-                        emp.save(update_fields=["is_approved", "login_active"])
-
-                    updated += 1
-
-                except Exception as e:
-                    errors += 1
-                    self.stdout.write(
-                        self.style.ERROR(f"[employers:{kind}] Row {idx} ERROR: {e}")
-                    )
+            email_idx = headers.index(email_key)
+            emails = [normalize_email(row[email_idx]) if len(row) > email_idx else "" for row in reader]
 
+        # Dry-run: one read-only lookup, report, done -- no transaction, no write path
         if dry_run:
+            would_update = _count_via_sql(emails, target_is_approved, target_login_active)
+            if would_update is not None:
+                updated, skipped, errors = would_update, len(emails) - would_update, 0
+            else:
+                to_update, skipped, errors = self._plan(emails, kind, csv_path)
+                updated = len(to_update)
             self.stdout.write(self.style.WARNING("[employers] DRY-RUN: no DB writes performed."))
+            self._report(kind, updated, skipped, errors)
+            return
+
+        # Lookup chunks and the UPDATE share one transaction: a single consistent snapshot
+        # and one commit, instead of an implicit transaction per statement
+        with transaction.atomic():
+            # Postgres: one COPY + one UPDATE ... FROM join, no Python-side matching at all
+            fast_updated = _apply_via_temp_table(emails, target_is_approved, target_login_active)
+
+            if fast_updated is not None:
+                updated, skipped, errors = fast_updated, len(emails) - fast_updated, 0
+            else:
+                to_update, skipped, errors = self._plan(emails, kind, csv_path)
+                updated = len(to_update)
+
+                # A few batched UPDATEs for all matched employers instead of one save() per row.
+                # Batches keep each pk IN (...) list well under backend parameter limits.
+                ids = sorted(to_update)
+                for i in range(0, len(ids), UPDATE_BATCH_SIZE):
+                    Employer.objects.filter(pk__in=ids[i : i + UPDATE_BATCH_SIZE]).update(
+                        is_approved=target_is_approved,
+                        login_active=target_login_active,
+                    )
+
+        self._report(kind, updated, skipped, errors)
+
+    def _plan(self, emails: list[str], kind: str, csv_path: str) -> tuple[set[int], int, int]:
+        """
+        Match CSV emails to employers that still need deactivating.
+        Returns (employer pks to update, rows skipped, rows errored).
+        Row errors go to <csv_path>.errors.csv (one buffered csv.writer), not one styled stdout line each.
+        """
+        skipped = 0
+        error_rows: list[tuple[int, str, str]] = []
+
+        # Chunked SELECTs for every employer the file mentions (stored emails are lowercase; the lowest id
+        # wins, the same rule as the Postgres paths). Plain (pk, is_approved, login_active) tuples: no model
+        # instances are built for the join.
+        employers_by_email = bulk_lookup(
+            Employer.objects.order_by("id"),
+            "email",
+            emails,
+            fields=["pk", "is_approved", "login_active"],
+        )
+
+        to_update: set[int] = set()
+        for idx, email in enumerate(emails, start=2):
+            try:
+                if not email:
+                    skipped += 1
+                    continue
+
+                emp = employers_by_email.get(email)
+                if not emp:
+                    skipped += 1
+                    continue
+
+                pk, is_approved, login_active = emp
+
+                # already inactive (or already queued by an earlier row) → skip
+                if (
+                    is_approved is False
+                    and login_active is False
+                ) or pk in to_update:
+                    skipped += 1
+                    continue
+
+                to_update.add(pk)
+
+            except Exception as e:
+                error_rows.append((idx, kind, str(e)))
+
+        if error_rows:
+            errors_path = f"{csv_path}.errors.csv"
+            with open(errors_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as err_f:
+                err_writer = csv.writer(err_f)
+                err_writer.writerow(["row", "kind", "error"])
+                err_writer.writerows(error_rows)
+            self.stdout.write(
+                self.style.ERROR(f"[employers:{kind}] {len(error_rows)} row error(s) written to {errors_path}")
+            )
+
+        return to_update, skipped, len(error_rows)
 
+    def _report(self, kind: str, updated: int, skipped: int, errors: int) -> None:
         self.stdout.write(
             self.style.SUCCESS(
                 f"[employers:{kind}] updated={updated} skipped={skipped} errors={errors}"
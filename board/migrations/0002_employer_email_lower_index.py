@@ -0,0 +1,20 @@
+# Generated by Django 5.2.5 on 2026-10-16 23:56
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='employer',
+            index=models.Index(django.db.models.functions.text.Lower('email'), name='idx_employer_email_lower'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-17 00:03
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0002_employer_email_lower_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='employer',
+            index=models.Index(condition=models.Q(('is_approved', True), ('login_active', True), _connector='OR'), fields=['id'], name='emp_active_any'),
+        ),
+    ]
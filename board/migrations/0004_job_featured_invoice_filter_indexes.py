@@ -0,0 +1,25 @@
+# Generated by Django 5.2.5 on 2026-10-17 00:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0003_employer_active_partial_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='invoice',
+            index=models.Index(fields=['status'], name='inv_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='invoice',
+            index=models.Index(fields=['processor'], name='inv_processor_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_featured', True)), fields=['-posting_date', '-id'], name='job_featured_recent_idx'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.5 on 2026-10-17 00:07
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F
+from django.db.models.functions import Lower
+
+
+def lowercase_emails(apps, schema_editor):
+    Employer = apps.get_model("board", "Employer")
+    # One UPDATE, touching only rows that actually have uppercase characters
+    Employer.objects.annotate(low=Lower("email")).exclude(email=F("low")).update(email=Lower("email"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0004_job_featured_invoice_filter_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(lowercase_emails, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name='employer',
+            name='idx_employer_email_lower',
+        ),
+        migrations.AddIndex(
+            model_name='employer',
+            index=models.Index(fields=['email'], name='idx_employer_email'),
+        ),
+    ]
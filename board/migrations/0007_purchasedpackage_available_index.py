@@ -0,0 +1,17 @@
+# Generated by Django 5.2.5 on 2026-10-17 00:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0006_job_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='purchasedpackage',
+            index=models.Index(condition=models.Q(('credits_remaining__gt', 0)), fields=['employer', 'expires_at'], name='purch_emp_avail_idx'),
+        ),
+    ]
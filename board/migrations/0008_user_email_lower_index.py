@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.db import migrations
+
+INDEX_NAME = "board_user_email_lower_idx"
+
+
+def _user_table(apps):
+    return apps.get_model(*settings.AUTH_USER_MODEL.split("."))._meta.db_table
+
+
+def add_index(apps, schema_editor):
+    # auth_user belongs to django.contrib.auth, so its functional index can't live in a model Meta.
+    # Serves the importers' case-insensitive user lookups (bulk_lookup(..., iexact=True) -> LOWER(email)).
+    qn = schema_editor.quote_name
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {qn(INDEX_NAME)} ON {qn(_user_table(apps))} (LOWER({qn('email')}))"
+    )
+
+
+def drop_index(apps, schema_editor):
+    schema_editor.execute(f"DROP INDEX IF EXISTS {schema_editor.quote_name(INDEX_NAME)}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("board", "0007_purchasedpackage_available_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(add_index, drop_index),
+    ]
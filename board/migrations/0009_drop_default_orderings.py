@@ -0,0 +1,29 @@
+# Generated by Django 5.2.5 on 2026-10-17 00:16
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0008_user_email_lower_index'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='invoice',
+            options={},
+        ),
+        migrations.AlterModelOptions(
+            name='job',
+            options={},
+        ),
+        migrations.AlterModelOptions(
+            name='jobalert',
+            options={},
+        ),
+        migrations.AlterModelOptions(
+            name='purchasedpackage',
+            options={},
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-17 00:17
+
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0009_drop_default_orderings'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='employer',
+            name='company_display',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf('company_name', models.Value('')), 'name'), output_field=models.CharField(max_length=200)),
+        ),
+    ]
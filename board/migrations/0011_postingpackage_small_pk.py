@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-17 00:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0010_employer_company_display'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='postingpackage',
+            name='id',
+            field=models.SmallAutoField(primary_key=True, serialize=False),
+        ),
+    ]
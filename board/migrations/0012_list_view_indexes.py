@@ -0,0 +1,33 @@
+# Generated by Django 5.2.5 on 2026-10-17 00:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0011_postingpackage_small_pk'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['job', '-created_at', '-id'], name='app_job_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['jobseeker', '-created_at', '-id'], name='app_js_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='invoice',
+            index=models.Index(fields=['employer', '-order_date', '-id'], name='inv_emp_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['expiry_date'], name='job_active_expiry_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resume',
+            index=models.Index(fields=['jobseeker', '-created_at', '-id'], name='resume_js_recent_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.5 on 2026-10-17 00:25
+
+import django.db.models.expressions
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0012_list_view_indexes'),
+    ]
+
+    operations = [
+        # Django can't alter a column into a GeneratedField: drop the stored copy, re-add it as derived from price_cents
+        migrations.RemoveField(
+            model_name='postingpackage',
+            name='price',
+        ),
+        migrations.AddField(
+            model_name='postingpackage',
+            name='price',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.expressions.CombinedExpression(models.F('price_cents'), '*', models.Value(Decimal('0.01'))), output_field=models.DecimalField(decimal_places=2, max_digits=10)),
+        ),
+    ]
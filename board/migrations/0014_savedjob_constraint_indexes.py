@@ -0,0 +1,30 @@
+# Generated by Django 5.2.5 on 2026-10-17 00:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0013_postingpackage_price_generated'),
+    ]
+
+    operations = [
+        # Named constraint first, so the pair is never unenforced between the two steps
+        migrations.AddConstraint(
+            model_name='savedjob',
+            constraint=models.UniqueConstraint(fields=('jobseeker', 'job'), name='uniq_saved_job'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='savedjob',
+            unique_together=set(),
+        ),
+        migrations.AddIndex(
+            model_name='savedjob',
+            index=models.Index(fields=['job', '-created_at', 'id'], name='saved_job_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='savedjob',
+            index=models.Index(fields=['jobseeker', '-created_at', 'id'], name='saved_js_recent_idx'),
+        ),
+    ]
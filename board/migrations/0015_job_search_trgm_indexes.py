@@ -0,0 +1,48 @@
+from django.db import migrations
+
+# job_list searches with title/description/location__icontains, which Postgres runs as
+# UPPER(col::text) LIKE UPPER('%q%'): a btree can't serve a leading wildcard, a trigram GIN index on
+# the same UPPER(...) expression can. Postgres-only (pg_trgm), so other backends (and Postgres servers
+# without the pg_trgm extension available) skip this migration.
+INDEXES = {
+    "board_job_title_trgm": "title",
+    "board_job_description_trgm": "description",
+    "board_job_location_trgm": "location",
+}
+
+
+def _trgm_available(schema_editor) -> bool:
+    # pg_trgm ships in postgresql-contrib; servers without it just go without these indexes
+    with schema_editor.connection.cursor() as cur:
+        cur.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        return cur.fetchone() is not None
+
+
+def add_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql" or not _trgm_available(schema_editor):
+        return
+    qn = schema_editor.quote_name
+    table = qn(apps.get_model("board", "Job")._meta.db_table)
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, column in INDEXES.items():
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {qn(name)} ON {table} USING gin (UPPER({qn(column)}::text) gin_trgm_ops)"
+        )
+
+
+def drop_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name in INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {schema_editor.quote_name(name)}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("board", "0014_savedjob_constraint_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(add_indexes, drop_indexes),
+    ]
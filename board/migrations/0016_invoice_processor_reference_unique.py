@@ -0,0 +1,17 @@
+# Generated by Django 5.2.5 on 2026-10-17 00:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0015_job_search_trgm_indexes'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='invoice',
+            constraint=models.UniqueConstraint(condition=models.Q(('processor_reference', ''), _negated=True), fields=('processor', 'processor_reference'), name='uniq_inv_proc_ref'),
+        ),
+    ]
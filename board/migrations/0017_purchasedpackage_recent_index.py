@@ -0,0 +1,17 @@
+# Generated by Django 5.2.5 on 2026-10-17 00:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0016_invoice_processor_reference_unique'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='purchasedpackage',
+            index=models.Index(fields=['employer', '-purchased_at', '-id'], name='purch_emp_recent_idx'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.5 on 2026-10-17 00:56
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def clear_expired(apps, schema_editor):
+    Job = apps.get_model("board", "Job")
+    # One UPDATE for the rows already past expiry; the field default covers the rest
+    Job.objects.filter(expiry_date__lt=timezone.localdate()).update(is_currently_active=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0017_purchasedpackage_recent_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='job',
+            name='job_featured_recent_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='job',
+            name='job_active_recent_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='job',
+            name='job_active_expiry_idx',
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='is_currently_active',
+            field=models.BooleanField(default=True, editable=False),
+        ),
+        migrations.RunPython(clear_expired, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_currently_active', True), ('is_featured', True)), fields=['-posting_date', '-id'], name='job_live_featured_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_currently_active', True)), fields=['-posting_date', '-id'], name='job_live_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('is_currently_active', True)), fields=['expiry_date'], name='job_live_expiry_idx'),
+        ),
+    ]
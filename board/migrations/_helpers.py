@@ -0,0 +1,31 @@
+"""
+Shared helpers for board's RunPython data migrations.
+(The migration loader skips modules whose name starts with "_", so this file is never treated as a migration.)
+"""
+
+
+def backfill_in_batches(qs, fields, mutate_fn, batch_size=5000):
+    """
+    Rewrite `fields` on every row of `qs` without one save() per row.
+    Rows are streamed in pk order with .iterator() (bounded memory), passed to mutate_fn(obj)
+    to change in place, and written back with one bulk_update per batch_size rows.
+    Returns the number of rows processed.
+
+    Use inside RunPython with historical models, e.g.:
+        Job = apps.get_model("board", "Job")
+        backfill_in_batches(Job.objects.filter(source=""), ["source"], lambda j: setattr(j, "source", "import"))
+    """
+    manager = qs.model._base_manager
+    total = 0
+    buf = []
+    for obj in qs.order_by("pk").iterator(chunk_size=batch_size):
+        mutate_fn(obj)
+        buf.append(obj)
+        if len(buf) >= batch_size:
+            manager.bulk_update(buf, fields, batch_size=batch_size)
+            total += len(buf)
+            buf.clear()
+    if buf:
+        manager.bulk_update(buf, fields, batch_size=batch_size)
+        total += len(buf)
+    return total
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
 import os
-import uuid
-from datetime import date, timedelta
+import secrets
+from datetime import timedelta
+from decimal import Decimal
 
 from django.conf import settings
-from django.core.validators import MinValueValidator, MaxValueValidator
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.validators import EMPTY_VALUES, MinValueValidator, MaxValueValidator
 from django.db import models
+from django.db.models import Sum
+from django.db.models.functions import Coalesce, NullIf, TruncMonth
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.text import slugify
@@ -18,19 +25,21 @@ from django.utils.text import slugify
 def _safe_name(filename: str) -> str:
     base, ext = os.path.splitext(filename or "")
     base = slugify(base or "file") or "file"
-    return f"{base}-{uuid.uuid4().hex[:8]}{ext.lower()}"
+    return f"{base}-{secrets.token_hex(4)}{ext.lower()}"
 
 
+# Storage names are "/"-separated on every OS, so the paths are plain f-strings (no os.path.join)
 def employer_logo_upload_path(instance, filename):
-    return os.path.join("employers", str(instance.pk or "new"), "logos", _safe_name(filename))
+    return f"employers/{instance.pk or 'new'}/logos/{_safe_name(filename)}"
 
 
 def resume_upload_path(instance, filename):
-    return os.path.join("jobseekers", str(getattr(instance, "jobseeker_id", "new")), "resumes", _safe_name(filename))
+    return f"jobseekers/{getattr(instance, 'jobseeker_id', 'new')}/resumes/{_safe_name(filename)}"
 
 
 def application_resume_upload_path(instance, filename):
-    return os.path.join("applications", "resumes", _safe_name(filename))
+    # One flat prefix for every application ever made: shard by month (like upload_to="...%Y/%m/")
+    return f"applications/resumes/{timezone.now():%Y/%m}/{_safe_name(filename)}"
 
 
 # Backward-compat for an older migration that referenced this name
@@ -40,12 +49,67 @@ def resume_item_upload_path(instance, filename):
 
 # Some older migrations referenced this upload helper for SiteSettings branding fields.
 def branding_upload_path(instance, filename):
-    return os.path.join("site", "branding", _safe_name(filename))
+    return f"site/branding/{_safe_name(filename)}"
+
+
+# ------------------------
+# Validation helpers
+# ------------------------
+def _choice_errors(instance, choice_values: dict, exclude) -> dict:
+    """
+    Choice validation for clean_fields() as set lookups: {field name: frozenset of allowed keys}.
+    Django's Field.validate() scans the choices tuple on every call; callers check these fields here
+    and exclude them from the default pass. Listed fields must be blank=True CharFields.
+    """
+    errors = {}
+    for name, allowed in choice_values.items():
+        if name in (exclude or ()):
+            continue
+        value = getattr(instance, name)
+        if value in EMPTY_VALUES or value in allowed:
+            continue
+        field = instance._meta.get_field(name)
+        errors[name] = [
+            ValidationError(field.error_messages["invalid_choice"], code="invalid_choice", params={"value": value})
+        ]
+    return errors
 
 
 # ------------------------
 # Settings / CMS-ish models
 # ------------------------
+# cache.get() default for "no entry", so a cached None (no row yet) is still a hit
+_NOT_CACHED = object()
+
+
+class SiteSettingsManager(models.Manager):
+    CACHE_KEY = "board:site_settings"
+    CACHE_TIMEOUT = 300
+
+    def first_value(self, field: str, default=None):
+        """
+        One column of the singleton row, e.g. first_value("posting_duration_days").
+        Helpers that need a single setting skip the wide TEXT/banner columns of a full-row fetch.
+        """
+        value = self.order_by("pk").values_list(field, flat=True).first()
+        return default if value is None else value
+
+    def current(self):
+        """
+        The singleton row for page rendering (context processor, views), without the legacy
+        TEXT columns no template reads (SiteSettings.UNRENDERED_FIELDS). Admin edits use the full row.
+        Cached: nearly every request reads it. Cleared on any SiteSettings save/delete (see receiver below).
+        """
+        obj = cache.get(self.CACHE_KEY, _NOT_CACHED)
+        if obj is _NOT_CACHED:
+            obj = self.defer(*self.model.UNRENDERED_FIELDS).order_by("pk").first()
+            cache.set(self.CACHE_KEY, obj, self.CACHE_TIMEOUT)
+        return obj
+
+    def clear_current(self) -> None:
+        cache.delete(self.CACHE_KEY)
+
+
 class SiteSettings(models.Model):
     """
     Admin-driven homepage + global site configuration.
@@ -108,6 +172,19 @@ class SiteSettings(models.Model):
     # Webhook legacy
     social_webhook_url = models.CharField(max_length=500, blank=True, default="")
 
+    # Legacy TEXT columns kept for the admin/migrations only; current() leaves them out of page loads
+    UNRENDERED_FIELDS = (
+        "footer_text",
+        "employer_column_content",
+        "jobseeker_column_content",
+        "seo_meta_description",
+        "side_banner_html",
+        "bottom_banner_html",
+        "branding_footer_html",
+    )
+
+    objects = SiteSettingsManager()
+
     class Meta:
         verbose_name = "Site Settings"
         verbose_name_plural = "Site Settings"
@@ -116,6 +193,11 @@ class SiteSettings(models.Model):
         return self.site_name or "SiteSettings"
 
 
+@receiver([post_save, post_delete], sender=SiteSettings)
+def _clear_site_settings_cache(sender, **kwargs):
+    sender.objects.clear_current()
+
+
 class WidgetTemplate(models.Model):
     name = models.CharField(max_length=120)
     slug = models.SlugField(unique=True)
@@ -156,9 +238,41 @@ class WebhookConfig(models.Model):
         return f"WebhookConfig #{self.pk or 'new'}"
 
 
+# ------------------------
+# Shared choices
+# ------------------------
+class JobType(models.TextChoices):
+    # Job.job_type and JobSeeker.opportunity_type use the same set
+    FULL_TIME = "full_time", "Full-time"
+    PART_TIME = "part_time", "Part-time"
+    CONTRACTOR = "contractor", "Contractor"
+    CASUAL = "casual", "Casual"
+    LOCUM = "locum", "Locum"
+    TEMPORARY = "temporary", "Temporary"
+
+
+class CompensationType(models.TextChoices):
+    HOURLY = "hourly", "Hourly"
+    YEARLY = "yearly", "Yearly"
+    SPLIT = "split", "Percent split"
+
+
+class ApplyVia(models.TextChoices):
+    EMAIL = "email", "Email"
+    URL = "url", "URL"
+
+
 # ------------------------
 # Core models
 # ------------------------
+class EmployerQuerySet(models.QuerySet):
+    def with_active_job_count(self):
+        # One COUNT per employer in the same query, instead of employer.jobs.filter(...).count() per row
+        return self.annotate(
+            active_jobs=models.Count("jobs", filter=models.Q(jobs__is_active=True, jobs__is_currently_active=True))
+        )
+
+
 class Employer(models.Model):
     user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="employer")
 
@@ -175,6 +289,13 @@ class Employer(models.Model):
     location = models.CharField(max_length=200, blank=True, default="")
     logo = models.ImageField(upload_to=employer_logo_upload_path, blank=True, null=True)
 
+    # Stored by the database on every write: company name, else contact name (what listings display)
+    company_display = models.GeneratedField(
+        expression=Coalesce(NullIf("company_name", models.Value("")), "name"),
+        output_field=models.CharField(max_length=200),
+        db_persist=True,
+    )
+
     is_approved = models.BooleanField(default=False)
     login_active = models.BooleanField(default=True)
     credits = models.PositiveIntegerField(default=0)
@@ -183,12 +304,30 @@ class Employer(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = EmployerQuerySet.as_manager()
+
     class Meta:
         ordering = ["company_name", "name", "id"]
+        indexes = [
+            # Emails are stored lowercase (see save()), so importers / status updater match by plain equality
+            models.Index(fields=["email"], name="idx_employer_email"),
+            # Partial: only still-active employers, so deactivation runs skip already-inactive rows cheaply
+            models.Index(
+                fields=["id"],
+                condition=models.Q(is_approved=True) | models.Q(login_active=True),
+                name="emp_active_any",
+            ),
+        ]
 
     def __str__(self):
         return self.company_name or self.name or (self.email or "")
 
+    def save(self, *args, **kwargs):
+        # Normalize at write time so lookups never need LOWER(email)
+        if self.email:
+            self.email = self.email.strip().lower()
+        super().save(*args, **kwargs)
+
     def get_absolute_url(self):
         return reverse("employer_public_profile", args=[self.pk])
 
@@ -204,15 +343,9 @@ class JobSeeker(models.Model):
 
     registered_in_canada = models.BooleanField(default=False)
 
-    OPPORTUNITY_CHOICES = (
-        ("full_time", "Full-time"),
-        ("part_time", "Part-time"),
-        ("contractor", "Contractor"),
-        ("casual", "Casual"),
-        ("locum", "Locum"),
-        ("temporary", "Temporary"),
-    )
+    OPPORTUNITY_CHOICES = JobType.choices
     opportunity_type = models.CharField(max_length=30, choices=OPPORTUNITY_CHOICES, blank=True, default="")
+    CHOICE_VALUES = {"opportunity_type": frozenset(dict(OPPORTUNITY_CHOICES))}
 
     current_location = models.CharField(max_length=200, blank=True, default="")
 
@@ -240,12 +373,48 @@ class JobSeeker(models.Model):
         full = f"{self.first_name or ''} {self.last_name or ''}".strip()
         return full or (self.email or "")
 
+    def clean_fields(self, exclude=None):
+        errors = _choice_errors(self, self.CHOICE_VALUES, exclude)
+        try:
+            super().clean_fields(exclude=set(exclude or ()) | set(self.CHOICE_VALUES))
+        except ValidationError as e:
+            errors = e.update_error_dict(errors)
+        if errors:
+            raise ValidationError(errors)
+
     @property
     def full_name(self) -> str:
         return f"{(self.first_name or '').strip()} {(self.last_name or '').strip()}".strip()
 
 
+class PostingPackageManager(models.Manager):
+    CACHE_KEY = "board:active_package_rows"
+    CACHE_TIMEOUT = 300
+    # What the pricing page renders
+    LISTING_FIELDS = ("id", "code", "name", "description", "price", "price_cents", "credits", "duration_days", "allows_featured")
+
+    def active_list(self) -> list[dict]:
+        """
+        Active packages in pricing-page order, as a cached list of plain dicts (values(): no model
+        instances to build or unpickle): packages change rarely but are read on every pricing page view.
+        Cleared on any package save/delete (see receiver below).
+        """
+        packages = cache.get(self.CACHE_KEY)
+        if packages is None:
+            packages = list(
+                self.filter(is_active=True).order_by("-priority_level", "price", "id").values(*self.LISTING_FIELDS)
+            )
+            cache.set(self.CACHE_KEY, packages, self.CACHE_TIMEOUT)
+        return packages
+
+    def clear_active_list(self) -> None:
+        # Call after bulk_create()/update(), which send no save signals
+        cache.delete(self.CACHE_KEY)
+
+
 class PostingPackage(models.Model):
+    # A handful of rows: a 2-byte key keeps purchasedpackage.package_id and its indexes narrow
+    id = models.SmallAutoField(primary_key=True)
     code = models.SlugField(max_length=80, unique=True, default="")
     name = models.CharField(max_length=150)
     description = models.TextField(blank=True, default="")
@@ -254,8 +423,13 @@ class PostingPackage(models.Model):
 
     credits = models.PositiveIntegerField(validators=[MinValueValidator(1)], default=1)
 
-    price = models.DecimalField(max_digits=10, decimal_places=2, default=0)
     price_cents = models.PositiveIntegerField(default=0)
+    # Derived by the database from price_cents on every write (single source of truth, nothing to sync in save())
+    price = models.GeneratedField(
+        expression=models.F("price_cents") * models.Value(Decimal("0.01")),
+        output_field=models.DecimalField(max_digits=10, decimal_places=2),
+        db_persist=True,
+    )
 
     allows_featured = models.BooleanField(default=False)
 
@@ -269,24 +443,48 @@ class PostingPackage(models.Model):
 
     package_expires_days = models.PositiveIntegerField(default=365)
 
+    objects = PostingPackageManager()
+
     class Meta:
         ordering = ["order", "name", "id"]
 
     def __str__(self):
         return f"{self.name} ({self.code})"
 
-    def save(self, *args, **kwargs):
-        try:
-            self.price = (int(self.price_cents or 0) / 100)
-        except Exception:
-            pass
-        super().save(*args, **kwargs)
-
     @property
     def price_display(self) -> str:
         return f"${(self.price_cents or 0) / 100:.2f}"
 
 
+@receiver([post_save, post_delete], sender=PostingPackage)
+def _clear_active_packages_cache(sender, **kwargs):
+    sender.objects.clear_active_list()
+
+
+class PurchasedPackageQuerySet(models.QuerySet):
+    def available(self, now=None):
+        # Spendable: credits left and not expired (the purch_emp_avail_idx partial index covers this per employer)
+        return self.filter(credits_remaining__gt=0, expires_at__gte=now or timezone.now())
+
+
+class PurchasedPackageManager(models.Manager.from_queryset(PurchasedPackageQuerySet)):
+    def grant(self, employer, package, source: str = "") -> "PurchasedPackage":
+        """
+        Record a purchase of `package`, taking credits/expiry from the package the caller already holds
+        so save() has nothing left to derive (no extra SELECT for the package).
+        """
+        credits = int(package.credits or 0)
+        return self.create(
+            employer=employer,
+            package=package,
+            credits_granted=credits,
+            credits_remaining=credits,
+            expires_at=timezone.now() + timedelta(days=int(package.package_expires_days or 0)),
+            duration_days=int(package.duration_days or 0),
+            source=source,
+        )
+
+
 class PurchasedPackage(models.Model):
     employer = models.ForeignKey(Employer, on_delete=models.CASCADE, related_name="purchases")
     package = models.ForeignKey(PostingPackage, on_delete=models.PROTECT, related_name="purchases")
@@ -302,47 +500,91 @@ class PurchasedPackage(models.Model):
     # Legacy field
     duration_days = models.PositiveIntegerField(default=0)
 
+    objects = PurchasedPackageManager()
+
     class Meta:
-        ordering = ["-purchased_at", "id"]
+        indexes = [
+            # Partial: credit checks only read packages with credits left, by employer, soonest expiry first
+            models.Index(
+                fields=["employer", "expires_at"],
+                condition=models.Q(credits_remaining__gt=0),
+                name="purch_emp_avail_idx",
+            ),
+            # Employer dashboard purchases table, newest first
+            models.Index(fields=["employer", "-purchased_at", "-id"], name="purch_emp_recent_idx"),
+        ]
 
     def __str__(self):
         return f"{self.employer} → {self.package} ({self.credits_remaining}/{self.credits_granted})"
 
     def save(self, *args, **kwargs):
-        is_new = self.pk is None
+        # Only fill what the caller left unset: rows built by objects.grant() never touch self.package here
+        if self.package_id:
+            if not self.credits_granted:
+                self.credits_granted = int(self.package.credits or 0)
 
-        if (is_new or not self.credits_granted) and self.package_id:
-            self.credits_granted = int(self.package.credits or 0)
+            if not self.credits_remaining:
+                self.credits_remaining = int(self.credits_granted or 0)
 
-        if (is_new or not self.credits_remaining) and self.package_id:
-            self.credits_remaining = int(self.credits_granted or 0)
-
-        if (is_new or not self.expires_at) and self.package_id:
-            self.expires_at = timezone.now() + timedelta(days=int(self.package.package_expires_days or 0))
+            if not self.expires_at:
+                self.expires_at = timezone.now() + timedelta(days=int(self.package.package_expires_days or 0))
 
         super().save(*args, **kwargs)
 
 
+class JobQuerySet(models.QuerySet):
+    def active(self):
+        # Published jobs (drafts have is_active=False), whether or not they have expired since
+        return self.filter(is_active=True)
+
+    def live(self):
+        # What the public pages list: published and not past expiry (see Job.is_currently_active)
+        return self.filter(is_active=True, is_currently_active=True)
+
+    def visible(self):
+        # Live and inside the posting window by date, for callers that can't wait for expire_jobs
+        today = timezone.localdate()
+        return self.live().filter(posting_date__lte=today).filter(
+            models.Q(expiry_date__isnull=True) | models.Q(expiry_date__gte=today)
+        )
+
+    def with_counts(self):
+        return self.annotate(app_count=models.Count("applications"))
+
+    def recent(self):
+        # Listing order. Job has no Meta.ordering, so counts/exists/subqueries don't carry an ORDER BY.
+        return self.order_by("-posting_date", "-id")
+
+
+class JobManager(models.Manager.from_queryset(JobQuerySet)):
+    """
+    Default manager: joins the employer up front, since job lists, admin and __str__ all read job.employer.
+    Use bare() for queries that never touch the employer (and for .only()/.defer(), which cannot defer
+    a select_related FK).
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().select_related("employer")
+
+    def bare(self):
+        return super().get_queryset()
+
+
 class Job(models.Model):
-    JOB_TYPE_CHOICES = (
-        ("full_time", "Full-time"),
-        ("part_time", "Part-time"),
-        ("contractor", "Contractor"),
-        ("casual", "Casual"),
-        ("locum", "Locum"),
-        ("temporary", "Temporary"),
-    )
+    JOB_TYPE_CHOICES = JobType.choices
+    COMP_TYPE_CHOICES = CompensationType.choices
+    APPLY_VIA_CHOICES = ApplyVia.choices
 
-    COMP_TYPE_CHOICES = (
-        ("hourly", "Hourly"),
-        ("yearly", "Yearly"),
-        ("split", "Percent split"),
-    )
+    # Built once: get_*_display below is a dict lookup instead of Django rebuilding the choices map per call
+    JOB_TYPE_LABELS = dict(JOB_TYPE_CHOICES)
+    COMP_TYPE_LABELS = dict(COMP_TYPE_CHOICES)
 
-    APPLY_VIA_CHOICES = (
-        ("email", "Email"),
-        ("url", "URL"),
-    )
+    # Same idea for validation: see clean_fields()
+    CHOICE_VALUES = {
+        "job_type": frozenset(JOB_TYPE_LABELS),
+        "compensation_type": frozenset(COMP_TYPE_LABELS),
+        "apply_via": frozenset(dict(APPLY_VIA_CHOICES)),
+    }
 
     employer = models.ForeignKey(Employer, on_delete=models.CASCADE, related_name="jobs")
 
@@ -376,6 +618,9 @@ class Job(models.Model):
     expiry_date = models.DateField(blank=True, null=True)
 
     is_active = models.BooleanField(default=True)
+    # Stored "not past expiry_date": save() sets it from the date and expire_jobs clears it as dates pass,
+    # so listings filter on two booleans (partial indexes below) instead of comparing against today
+    is_currently_active = models.BooleanField(default=True, editable=False)
 
     is_featured = models.BooleanField(default=False)
     featured = models.BooleanField(default=False)
@@ -387,12 +632,48 @@ class Job(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = JobManager()
+
     class Meta:
-        ordering = ["-posting_date", "-id"]
+        indexes = [
+            # Partial: the home page's featured strip reads only live+featured rows, newest first
+            models.Index(
+                fields=["-posting_date", "-id"],
+                condition=models.Q(is_active=True, is_currently_active=True, is_featured=True),
+                name="job_live_featured_idx",
+            ),
+            # Partial: public job list / home page read only live rows in recent() order
+            models.Index(
+                fields=["-posting_date", "-id"],
+                condition=models.Q(is_active=True, is_currently_active=True),
+                name="job_live_recent_idx",
+            ),
+            # Employer profile + dashboard: one employer's jobs, newest first
+            models.Index(fields=["employer", "-posting_date", "-id"], name="job_employer_post_idx"),
+            # Partial: expire_jobs looks for not-yet-expired rows past their expiry date
+            models.Index(
+                fields=["expiry_date"], condition=models.Q(is_currently_active=True), name="job_live_expiry_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title} @ {self.employer}"
 
+    def clean_fields(self, exclude=None):
+        errors = _choice_errors(self, self.CHOICE_VALUES, exclude)
+        try:
+            super().clean_fields(exclude=set(exclude or ()) | set(self.CHOICE_VALUES))
+        except ValidationError as e:
+            errors = e.update_error_dict(errors)
+        if errors:
+            raise ValidationError(errors)
+
+    def get_job_type_display(self):
+        return self.JOB_TYPE_LABELS.get(self.job_type, self.job_type)
+
+    def get_compensation_type_display(self):
+        return self.COMP_TYPE_LABELS.get(self.compensation_type, self.compensation_type)
+
     def get_absolute_url(self):
         return reverse("job_detail", args=[self.pk])
 
@@ -400,7 +681,15 @@ class Job(models.Model):
     def is_expired(self) -> bool:
         if not self.expiry_date:
             return False
-        return date.today() > self.expiry_date
+        return timezone.localdate() > self.expiry_date
+
+    def save(self, *args, **kwargs):
+        # Keep the stored flag in step with expiry_date on every save (admin edits, republishing, imports)
+        self.is_currently_active = not self.is_expired
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "expiry_date" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "is_currently_active"}
+        super().save(*args, **kwargs)
 
 
 class Resume(models.Model):
@@ -413,6 +702,10 @@ class Resume(models.Model):
 
     class Meta:
         ordering = ["-created_at", "id"]
+        indexes = [
+            # Job seeker dashboard / application form: own resumes, newest first
+            models.Index(fields=["jobseeker", "-created_at", "-id"], name="resume_js_recent_idx"),
+        ]
 
     def __str__(self):
         return f"{self.title} ({self.jobseeker})"
@@ -439,6 +732,11 @@ class Application(models.Model):
 
     class Meta:
         ordering = ["-created_at", "id"]
+        indexes = [
+            # Employer dashboard (via job) and job seeker dashboard, newest first
+            models.Index(fields=["job", "-created_at", "-id"], name="app_job_recent_idx"),
+            models.Index(fields=["jobseeker", "-created_at", "-id"], name="app_js_recent_idx"),
+        ]
 
     def __str__(self):
         return f"{self.jobseeker} → {self.job}"
@@ -450,8 +748,16 @@ class SavedJob(models.Model):
     created_at = models.DateTimeField(default=timezone.now, editable=False)
 
     class Meta:
-        unique_together = ("jobseeker", "job")
         ordering = ["-created_at", "id"]
+        constraints = [
+            models.UniqueConstraint(fields=["jobseeker", "job"], name="uniq_saved_job"),
+        ]
+        indexes = [
+            # "Who saved this job" (the unique index leads with jobseeker, so it can't serve job_id lookups in order)
+            models.Index(fields=["job", "-created_at", "id"], name="saved_job_recent_idx"),
+            # A job seeker's saved list, newest first
+            models.Index(fields=["jobseeker", "-created_at", "id"], name="saved_js_recent_idx"),
+        ]
 
     def __str__(self):
         return f"{self.jobseeker} saved {self.job}"
@@ -464,9 +770,6 @@ class JobAlert(models.Model):
     active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
-    class Meta:
-        ordering = ["-created_at", "id"]
-
     def __str__(self):
         return f"{self.email} ({self.q} @ {self.location})"
 
@@ -518,6 +821,7 @@ class PaymentGatewayConfig(models.Model):
 
     @classmethod
     def get_active_gateway(cls):
+        # Not cached: payment keys/mode must never be served stale from another worker's cache
         return cls.objects.filter(is_active=True).order_by("-updated_at", "-id").first()
 
 
@@ -551,10 +855,12 @@ class DiscountCode(models.Model):
     def __str__(self):
         return self.code
 
-    def is_valid_now(self) -> bool:
+    def is_valid_on(self, today=None) -> bool:
+        # Pass `today` when checking many codes/prices in one go, so the date is computed once
         if not self.is_active:
             return False
-        today = timezone.now().date()
+        if today is None:
+            today = timezone.localdate()
         if self.start_date and today < self.start_date:
             return False
         if self.end_date and today > self.end_date:
@@ -563,18 +869,39 @@ class DiscountCode(models.Model):
             return False
         return True
 
-    def apply_to_cents(self, price_cents: int) -> int:
+    def is_valid_now(self) -> bool:
+        return self.is_valid_on()
+
+    def apply_to_cents(self, price_cents: int, today=None) -> int:
         price_cents = int(price_cents or 0)
-        if not self.is_valid_now():
+        if not self.is_valid_on(today):
             return price_cents
 
         if self.kind == "percent":
             pct = max(0, min(100, int(self.value or 0)))
-            new_val = round(price_cents * (100 - pct) / 100)
+            # Integer cents, half-up (no float round-trip)
+            new_val = (price_cents * (100 - pct) + 50) // 100
         else:
             new_val = price_cents - int(self.value or 0)
 
-        return max(0, int(new_val))
+        return max(0, new_val)
+
+
+class InvoiceQuerySet(models.QuerySet):
+    def monthly_totals(self) -> list[tuple]:
+        """
+        [(month, total_cents), ...] oldest first for the invoices in this queryset, summed by the database
+        (GROUP BY month): reporting never pulls invoice rows into Python. Narrow it with filter() first,
+        e.g. Invoice.objects.filter(employer_id=..., status="paid").monthly_totals().
+        """
+        return list(
+            self.order_by()
+            .annotate(month=TruncMonth("order_date"))
+            .values("month")
+            .annotate(total=Sum("amount"))
+            .order_by("month")
+            .values_list("month", "total")
+        )
 
 
 class Invoice(models.Model):
@@ -591,6 +918,10 @@ class Invoice(models.Model):
         ("manual", "Manual"),
     )
 
+    # Built once: get_*_display below is a dict lookup instead of Django rebuilding the choices map per call
+    STATUS_LABELS = dict(STATUS_CHOICES)
+    PROCESSOR_LABELS = dict(PROCESSOR_CHOICES)
+
     employer = models.ForeignKey(Employer, on_delete=models.CASCADE, related_name="invoices")
 
     amount = models.PositiveIntegerField(default=0)  # cents
@@ -606,12 +937,35 @@ class Invoice(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = InvoiceQuerySet.as_manager()
+
     class Meta:
-        ordering = ["-order_date", "id"]
+        indexes = [
+            # Admin list_filter columns
+            models.Index(fields=["status"], name="inv_status_idx"),
+            models.Index(fields=["processor"], name="inv_processor_idx"),
+            # Employer dashboard invoice table, newest first
+            models.Index(fields=["employer", "-order_date", "-id"], name="inv_emp_recent_idx"),
+        ]
+        constraints = [
+            # One invoice per gateway payment (e.g. Stripe session); also the index behind reference lookups.
+            # Imported/manual invoices have no reference and are not constrained.
+            models.UniqueConstraint(
+                fields=["processor", "processor_reference"],
+                condition=~models.Q(processor_reference=""),
+                name="uniq_inv_proc_ref",
+            ),
+        ]
 
     def __str__(self):
         return f"Invoice #{self.pk} for {self.employer}"
 
+    def get_status_display(self):
+        return self.STATUS_LABELS.get(self.status, self.status)
+
+    def get_processor_display(self):
+        return self.PROCESSOR_LABELS.get(self.processor, self.processor)
+
     @property
     def amount_display(self) -> str:
         return f"${(self.amount or 0) / 100:.2f}"
@@ -21,7 +21,7 @@ def get_settings() -> Optional[SiteSettings]:
     table/columns aren't ready (migrations).
     """
     try:
-        return SiteSettings.objects.first()
+        return SiteSettings.objects.current()
     except (OperationalError, ProgrammingError, ImproperlyConfigured):
         return None
 
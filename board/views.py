@@ -11,7 +11,8 @@ from django.contrib import messages
 from django.contrib.auth import login, logout
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import PermissionDenied
-from django.db.models import Count, Q, Sum
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q, Sum
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
@@ -105,9 +106,9 @@ def _admin_emails() -> list[str]:
     3) settings.SITE_ADMIN_EMAIL
     """
     try:
-        s = SiteSettings.objects.first()
-        if s and getattr(s, "contact_email", None):
-            return [s.contact_email]
+        contact_email = SiteSettings.objects.first_value("contact_email")
+        if contact_email:
+            return [contact_email]
     except Exception:
         pass
 
@@ -144,10 +145,7 @@ def send_templated_email(key: str, to_emails: list[str], context: dict) -> bool:
 # ============================================================
 
 def _gateway_config() -> Optional[PaymentGatewayConfig]:
-    try:
-        return PaymentGatewayConfig.active()
-    except Exception:
-        return PaymentGatewayConfig.objects.filter(is_active=True).first()
+    return PaymentGatewayConfig.get_active_gateway()
 
 
 def _gateway_context() -> dict:
@@ -168,7 +166,7 @@ def _apply_discount(package: PostingPackage, code_raw: str) -> tuple[Optional[Di
     if not code:
         return None, base, None
 
-    today = timezone.now().date()
+    today = timezone.localdate()
     dc = DiscountCode.objects.filter(code__iexact=code, is_active=True).first()
     if not dc:
         return None, base, "Invalid discount code."
@@ -176,23 +174,17 @@ def _apply_discount(package: PostingPackage, code_raw: str) -> tuple[Optional[Di
     if getattr(dc, "applicable_package_id", None) and dc.applicable_package_id != package.id:
         return None, base, "This discount code is not valid for this package."
 
-    if getattr(dc, "start_date", None) and today < dc.start_date:
+    # Specific messages first; is_valid_on() is the single validity rule (dates + max_uses)
+    if dc.start_date and today < dc.start_date:
         return None, base, "This discount code is not active yet."
-    if getattr(dc, "end_date", None) and today > dc.end_date:
+    if dc.end_date and today > dc.end_date:
         return None, base, "This discount code has expired."
+    if not dc.is_valid_on(today):
+        return None, base, "This discount code is no longer available."
 
-    try:
-        if dc.kind == "percent":
-            pct = Decimal(str(dc.value))
-            final = base * (Decimal("1.0") - (pct / Decimal("100.0")))
-        else:
-            final = base - Decimal(str(dc.value))
-    except Exception:
-        return None, base, "Invalid discount configuration."
-
-    if final < 0:
-        final = Decimal("0.00")
-    return dc, final.quantize(Decimal("0.01")), None
+    # DiscountCode.apply_to_cents() does the math on integer cents (fixed values are cents)
+    final_cents = dc.apply_to_cents(package.price_cents, today)
+    return dc, (Decimal(final_cents) / 100).quantize(Decimal("0.01")), None
 
 
 # ============================================================
@@ -200,8 +192,7 @@ def _apply_discount(package: PostingPackage, code_raw: str) -> tuple[Optional[Di
 # ============================================================
 
 def _available_packages_qs(employer: Employer):
-    now = timezone.now()
-    return PurchasedPackage.objects.filter(employer=employer, expires_at__gte=now, credits_remaining__gt=0)
+    return PurchasedPackage.objects.filter(employer=employer).available()
 
 
 def _available_credits(employer: Employer) -> int:
@@ -209,19 +200,50 @@ def _available_credits(employer: Employer) -> int:
     return int(total or 0)
 
 
-def _sync_employer_credits(employer: Employer) -> None:
-    try:
-        employer.credits = _available_credits(employer)
-        employer.save(update_fields=["credits"])
-    except Exception:
-        return
+def _sync_employer_credits(employer: Employer) -> int:
+    """
+    Recompute the employer's available credits (one aggregate) and return the total.
+    The UPDATE is skipped when the stored value is already current.
+    """
+    credits = _available_credits(employer)
+    if employer.credits != credits:
+        try:
+            employer.credits = credits
+            employer.save(update_fields=["credits"])
+        except Exception:
+            pass
+    return credits
+
+
+def _consume_credit(employer: Employer, package: Optional[PurchasedPackage]) -> bool:
+    """
+    Spend one credit and resync the employer's total. Returns False if no package had a credit left.
+    The request's active_package (already fetched for the form) is tried first; if it was drained since
+    (another tab, a concurrent publish), the employer's other available packages are tried in spending order.
+    Each decrement is a single conditional UPDATE, so a credit is never spent twice.
+    """
+    tried = set()
+    while True:
+        if package is None or package.pk in tried:
+            package = _available_packages_qs(employer).exclude(pk__in=tried).order_by("expires_at", "id").first()
+            if package is None:
+                _sync_employer_credits(employer)
+                return False
+        tried.add(package.pk)
+        spent = PurchasedPackage.objects.filter(pk=package.pk, credits_remaining__gt=0).update(
+            credits_remaining=F("credits_remaining") - 1
+        )
+        if spent:
+            _sync_employer_credits(employer)
+            return True
+        package = None
 
 
 def _posting_duration_days_for_employer(_: Employer) -> int:
-    s = SiteSettings.objects.first()
-    if s and getattr(s, "posting_duration_days", None):
+    days = SiteSettings.objects.first_value("posting_duration_days")
+    if days:
         try:
-            return int(s.posting_duration_days)
+            return int(days)
         except Exception:
             pass
     return 30
@@ -237,18 +259,17 @@ def _max_expiry_date_last_day(posting_date, duration_days: int):
 # ============================================================
 
 def home(request: HttpRequest) -> HttpResponse:
-    sitesettings = SiteSettings.objects.first()
+    sitesettings = SiteSettings.objects.current()
 
     jobs = (
-        Job.objects.filter(is_active=True)
-        .select_related("employer")
-        .order_by("-posting_date", "-id")[:3]
+        Job.objects.live()
+        .recent()[:3]
     )
 
     featured_jobs = (
-        Job.objects.filter(is_active=True, is_featured=True)
-        .select_related("employer")
-        .order_by("-posting_date", "-id")[:6]
+        Job.objects.live()
+        .filter(is_featured=True)
+        .recent()[:6]
     )
 
     job_alert_form = JobAlertForm()
@@ -266,15 +287,15 @@ def home(request: HttpRequest) -> HttpResponse:
 
 
 def about(request: HttpRequest) -> HttpResponse:
-    return render(request, "board/about.html", {"sitesettings": SiteSettings.objects.first()})
+    return render(request, "board/about.html", {"sitesettings": SiteSettings.objects.current()})
 
 
 def contact(request: HttpRequest) -> HttpResponse:
-    return render(request, "board/contact.html", {"sitesettings": SiteSettings.objects.first()})
+    return render(request, "board/contact.html", {"sitesettings": SiteSettings.objects.current()})
 
 
 def terms(request: HttpRequest) -> HttpResponse:
-    return render(request, "board/terms.html", {"sitesettings": SiteSettings.objects.first()})
+    return render(request, "board/terms.html", {"sitesettings": SiteSettings.objects.current()})
 
 
 # ============================================================
@@ -291,7 +312,7 @@ def logout_view(request: HttpRequest) -> HttpResponse:
 
 
 def login_view(request: HttpRequest) -> HttpResponse:
-    sitesettings = SiteSettings.objects.first()
+    sitesettings = SiteSettings.objects.current()
     form = LoginForm(request, data=request.POST or None)
 
     if request.method == "POST":
@@ -340,7 +361,7 @@ def login_view(request: HttpRequest) -> HttpResponse:
 # ============================================================
 
 def job_alert_signup(request: HttpRequest) -> HttpResponse:
-    sitesettings = SiteSettings.objects.first()
+    sitesettings = SiteSettings.objects.current()
     form = JobAlertForm(request.POST or None)
     if request.method == "POST" and form.is_valid():
         # Your JobAlert model was not included here; keep as-is if you have one.
@@ -360,7 +381,7 @@ def job_alert_signup(request: HttpRequest) -> HttpResponse:
 # ============================================================
 
 def employer_signup(request: HttpRequest) -> HttpResponse:
-    sitesettings = SiteSettings.objects.first()
+    sitesettings = SiteSettings.objects.current()
     form = EmployerSignUpForm(request.POST or None, request.FILES or None)
     if request.method == "POST" and form.is_valid():
         user = form.save()
@@ -383,12 +404,12 @@ def employer_signup(request: HttpRequest) -> HttpResponse:
 
 
 def employer_list(request: HttpRequest) -> HttpResponse:
-    sitesettings = SiteSettings.objects.first()
+    sitesettings = SiteSettings.objects.current()
 
-    # FIX: Employer -> related_name is "jobs" (plural), not "job"
+    # Active job count per employer in the same query (annotated as active_jobs)
     employers = (
         Employer.objects.filter(is_approved=True)
-        .annotate(active_jobs=Count("jobs", filter=Q(jobs__is_active=True)))
+        .with_active_job_count()
         .filter(active_jobs__gt=0)
         .order_by("company_name", "id")
     )
@@ -396,9 +417,9 @@ def employer_list(request: HttpRequest) -> HttpResponse:
 
 
 def employer_detail(request: HttpRequest, employer_id: int) -> HttpResponse:
-    sitesettings = SiteSettings.objects.first()
+    sitesettings = SiteSettings.objects.current()
     employer = get_object_or_404(Employer, id=employer_id, is_approved=True)
-    jobs = Job.objects.filter(employer=employer, is_active=True).order_by("-posting_date", "-id")
+    jobs = Job.objects.live().filter(employer=employer).recent()
     return render(
         request,
         "board/employer_detail.html",
@@ -411,7 +432,7 @@ def employer_detail(request: HttpRequest, employer_id: int) -> HttpResponse:
 # ============================================================
 
 def jobseeker_signup(request: HttpRequest) -> HttpResponse:
-    sitesettings = SiteSettings.objects.first()
+    sitesettings = SiteSettings.objects.current()
     form = JobSeekerSignUpForm(request.POST or None, request.FILES or None)
     if request.method == "POST" and form.is_valid():
         user = form.save()
@@ -435,23 +456,23 @@ def jobseeker_signup(request: HttpRequest) -> HttpResponse:
 # ============================================================
 
 def job_list(request: HttpRequest) -> HttpResponse:
-    sitesettings = SiteSettings.objects.first()
+    sitesettings = SiteSettings.objects.current()
     q = (request.GET.get("q") or "").strip()
     loc = (request.GET.get("location") or "").strip()
 
-    qs = Job.objects.filter(is_active=True).select_related("employer")
+    qs = Job.objects.live()
     if q:
         qs = qs.filter(Q(title__icontains=q) | Q(description__icontains=q) | Q(employer__company_name__icontains=q))
     if loc:
         qs = qs.filter(location__icontains=loc)
 
-    jobs = qs.order_by("-posting_date", "-id")
+    jobs = qs.recent()
     return render(request, "board/job_list.html", {"sitesettings": sitesettings, "jobs": jobs, "q": q, "location": loc})
 
 
 def job_detail(request: HttpRequest, job_id: int) -> HttpResponse:
-    sitesettings = SiteSettings.objects.first()
-    job = get_object_or_404(Job.objects.select_related("employer"), id=job_id, is_active=True)
+    sitesettings = SiteSettings.objects.current()
+    job = get_object_or_404(Job.objects.live(), id=job_id)
     job_alert_form = JobAlertForm()
     return render(
         request,
@@ -486,27 +507,18 @@ def job_create(request: HttpRequest) -> HttpResponse:
         publish = action != "draft"
         job.is_active = bool(publish)
 
-        if publish and _available_credits(employer) <= 0:
+        if publish and active_package is None:
             messages.error(request, "You have no credits available. Please purchase a package.")
             return redirect("package_list")
 
-        job.save()
+        # Charge before the job goes live; the job is only saved active if a credit was actually spent
+        with transaction.atomic():
+            if publish and not _consume_credit(employer, active_package):
+                messages.error(request, "You have no credits available. Please purchase a package.")
+                return redirect("package_list")
+            job.save()
 
         if publish:
-            pkg = (
-                PurchasedPackage.objects.filter(
-                    employer=employer,
-                    expires_at__gte=timezone.now(),
-                    credits_remaining__gt=0,
-                )
-                .order_by("expires_at", "id")
-                .first()
-            )
-            if pkg:
-                pkg.credits_remaining = max(0, int(pkg.credits_remaining) - 1)
-                pkg.save(update_fields=["credits_remaining"])
-            _sync_employer_credits(employer)
-
             send_templated_email(
                 "job_posting_confirmation",
                 [getattr(employer, "email", "")],
@@ -536,12 +548,23 @@ def job_edit(request: HttpRequest, job_id: int) -> HttpResponse:
     employer = request.user.employer
     job = get_object_or_404(Job, id=job_id, employer=employer)
 
-    posting_date = job.posting_date or timezone.now().date()
+    # An expired job (swept by expire_jobs, or past its date and not swept yet) is reposted on a fresh
+    # posting window starting today, so the employer can pick a new expiry date
+    today = timezone.localdate()
+    expired = job.is_expired or not job.is_currently_active
+    posting_date = today if expired else (job.posting_date or today)
     duration_days = _posting_duration_days_for_employer(employer)
     max_expiry = _max_expiry_date_last_day(posting_date, duration_days)
 
     active_package = _available_packages_qs(employer).order_by("expires_at", "id").first()
-    form = JobForm(request.POST or None, instance=job, max_expiry_date=max_expiry)
+    form = JobForm(
+        request.POST or None,
+        instance=job,
+        # Blank the stale date so the form defaults to the last day of the new window
+        initial={"expiry_date": None} if expired else None,
+        max_expiry_date=max_expiry,
+        min_expiry_date=today if expired else None,
+    )
 
     if request.method == "POST" and form.is_valid():
         updated = form.save(commit=False)
@@ -549,28 +572,22 @@ def job_edit(request: HttpRequest, job_id: int) -> HttpResponse:
         action = (request.POST.get("action") or "publish").strip().lower()
         publish = action != "draft"
 
-        if publish and not job.is_active and _available_credits(employer) <= 0:
+        # Going live from a draft or from expired is a new posting and spends a credit
+        charge = publish and (not job.is_active or expired)
+
+        if charge and active_package is None:
             messages.error(request, "You have no credits available. Please purchase a package.")
             return redirect("package_list")
 
-        was_inactive = not job.is_active
         updated.is_active = bool(publish)
-        updated.save()
+        if expired:
+            updated.posting_date = posting_date
 
-        if publish and was_inactive:
-            pkg = (
-                PurchasedPackage.objects.filter(
-                    employer=employer,
-                    expires_at__gte=timezone.now(),
-                    credits_remaining__gt=0,
-                )
-                .order_by("expires_at", "id")
-                .first()
-            )
-            if pkg:
-                pkg.credits_remaining = max(0, int(pkg.credits_remaining) - 1)
-                pkg.save(update_fields=["credits_remaining"])
-            _sync_employer_credits(employer)
+        with transaction.atomic():
+            if charge and not _consume_credit(employer, active_package):
+                messages.error(request, "You have no credits available. Please purchase a package.")
+                return redirect("package_list")
+            updated.save()
 
         messages.success(request, "Job updated.")
         return redirect("employer_dashboard")
@@ -582,8 +599,10 @@ def job_edit(request: HttpRequest, job_id: int) -> HttpResponse:
             "form": form,
             "mode": "edit",
             "job": job,
+            "expired": expired,
             "active_package": active_package,
             "max_expiry_iso": max_expiry.isoformat(),
+            "min_expiry_iso": today.isoformat() if expired else "",
         },
     )
 
@@ -627,26 +646,15 @@ def job_duplicate(request: HttpRequest, job_id: int) -> HttpResponse:
         publish = action != "draft"
         job.is_active = bool(publish)
 
-        if publish and _available_credits(employer) <= 0:
+        if publish and active_package is None:
             messages.error(request, "You have no credits available. Please purchase a package.")
             return redirect("package_list")
 
-        job.save()
-
-        if publish:
-            pkg = (
-                PurchasedPackage.objects.filter(
-                    employer=employer,
-                    expires_at__gte=timezone.now(),
-                    credits_remaining__gt=0,
-                )
-                .order_by("expires_at", "id")
-                .first()
-            )
-            if pkg:
-                pkg.credits_remaining = max(0, int(pkg.credits_remaining) - 1)
-                pkg.save(update_fields=["credits_remaining"])
-            _sync_employer_credits(employer)
+        with transaction.atomic():
+            if publish and not _consume_credit(employer, active_package):
+                messages.error(request, "You have no credits available. Please purchase a package.")
+                return redirect("package_list")
+            job.save()
 
         messages.success(request, "Job duplicated.")
         return redirect("employer_dashboard")
@@ -676,7 +684,7 @@ def job_apply(request: HttpRequest, job_id: int) -> HttpResponse:
         messages.error(request, "Your job seeker account is pending approval.")
         return redirect("jobseeker_dashboard")
 
-    job = get_object_or_404(Job.objects.select_related("employer"), id=job_id, is_active=True)
+    job = get_object_or_404(Job.objects.live(), id=job_id)
     resumes = Resume.objects.filter(jobseeker=js).order_by("-created_at", "-id")
 
     form = JobApplicationForm(request.POST or None)
@@ -707,7 +715,7 @@ def job_apply(request: HttpRequest, job_id: int) -> HttpResponse:
         request,
         "board/job_apply.html",
         {
-            "sitesettings": SiteSettings.objects.first(),
+            "sitesettings": SiteSettings.objects.current(),
             "job": job,
             "form": form,
             "jobseeker": js,
@@ -726,9 +734,9 @@ def employer_dashboard(request: HttpRequest) -> HttpResponse:
         raise PermissionDenied
 
     employer = request.user.employer
-    _sync_employer_credits(employer)
+    available_credits = _sync_employer_credits(employer)
 
-    jobs = Job.objects.filter(employer=employer).order_by("-posting_date", "-id")
+    jobs = Job.objects.filter(employer=employer).with_counts().recent()
     applications = (
         Application.objects.filter(job__employer=employer)
         .select_related("job", "jobseeker")
@@ -736,21 +744,25 @@ def employer_dashboard(request: HttpRequest) -> HttpResponse:
     )
     invoices = Invoice.objects.filter(employer=employer).order_by("-order_date", "-id")
 
-    packages = PurchasedPackage.objects.filter(employer=employer).order_by("-purchased_at", "-id")
+    packages = (
+        PurchasedPackage.objects.filter(employer=employer)
+        .select_related("package")  # table shows pp.package.name per row
+        .order_by("-purchased_at", "-id")
+    )
     purchased_packages = packages
 
     return render(
         request,
         "board/employer_dashboard.html",
         {
-            "sitesettings": SiteSettings.objects.first(),
+            "sitesettings": SiteSettings.objects.current(),
             "employer": employer,
             "jobs": jobs,
             "applications": applications,
             "invoices": invoices,
             "packages": packages,
             "purchased_packages": purchased_packages,
-            "available_credits": _available_credits(employer),
+            "available_credits": available_credits,
         },
     )
 
@@ -787,7 +799,7 @@ def jobseeker_dashboard(request: HttpRequest) -> HttpResponse:
         request,
         "board/jobseeker_dashboard.html",
         {
-            "sitesettings": SiteSettings.objects.first(),
+            "sitesettings": SiteSettings.objects.current(),
             "jobseeker": js,
             "resumes": resumes,
             "applications": applications,
@@ -878,7 +890,7 @@ def employer_profile_edit(request: HttpRequest) -> HttpResponse:
     return render(
         request,
         "board/employer_profile_edit.html",
-        {"sitesettings": SiteSettings.objects.first(), "form": form, "employer": employer},
+        {"sitesettings": SiteSettings.objects.current(), "form": form, "employer": employer},
     )
 
 
@@ -895,7 +907,7 @@ def jobseeker_profile_edit(request: HttpRequest) -> HttpResponse:
         messages.success(request, "Profile updated.")
         return redirect("jobseeker_dashboard")
 
-    return render(request, "board/jobseeker_profile_edit.html", {"sitesettings": SiteSettings.objects.first(), "form": form, "jobseeker": js})
+    return render(request, "board/jobseeker_profile_edit.html", {"sitesettings": SiteSettings.objects.current(), "form": form, "jobseeker": js})
 
 
 # ============================================================
@@ -903,8 +915,8 @@ def jobseeker_profile_edit(request: HttpRequest) -> HttpResponse:
 # ============================================================
 
 def package_list(request: HttpRequest) -> HttpResponse:
-    sitesettings = SiteSettings.objects.first()
-    packages = PostingPackage.objects.filter(is_active=True).order_by("-priority_level", "price", "id")
+    sitesettings = SiteSettings.objects.current()
+    packages = PostingPackage.objects.active_list()
     ctx = {"sitesettings": sitesettings, "packages": packages}
     ctx.update(_gateway_context())
     return render(request, "board/package_list.html", ctx)
@@ -928,7 +940,7 @@ def checkout_select(request: HttpRequest, package_id: int) -> HttpResponse:
         return redirect("employer_dashboard")
 
     package = get_object_or_404(PostingPackage, id=package_id, is_active=True)
-    ctx = {"sitesettings": SiteSettings.objects.first(), "package": package}
+    ctx = {"sitesettings": SiteSettings.objects.current(), "package": package}
     ctx.update(_gateway_context())
     return render(request, "checkout/checkout_select.html", ctx)
 
@@ -1002,7 +1014,7 @@ def checkout_start(request: HttpRequest, package_id: int) -> HttpResponse:
 
     # ===== PayPal (or other non-stripe flow): show checkout.html =====
     ctx = {
-        "sitesettings": SiteSettings.objects.first(),
+        "sitesettings": SiteSettings.objects.current(),
         "package": package,
         "payment_method": payment_method,
         "discount_code": discount_code,
@@ -1049,31 +1061,27 @@ def checkout_success(request: HttpRequest) -> HttpResponse:
 
         package = get_object_or_404(PostingPackage, id=pkg_id, is_active=True)
 
-        # Prevent duplicates if refreshing success page:
-        existing = Invoice.objects.filter(processor="stripe", processor_reference=session_id).first()
-        if not existing:
-            amount_total = getattr(session, "amount_total", None)
-            paid_amount = Decimal(str(package.price)) if amount_total is None else (Decimal(amount_total) / Decimal("100"))
-            used_code = (md.get("discount_code") or "").strip() or None
-
-            Invoice.objects.create(
-                employer=employer,
-                amount=paid_amount,
-                currency="CAD",
-                processor="stripe",
-                status="paid",
-                processor_reference=session_id,
-                discount_code=used_code,
-            )
+        amount_total = getattr(session, "amount_total", None)
+        paid_amount = Decimal(str(package.price)) if amount_total is None else (Decimal(amount_total) / Decimal("100"))
+        used_code = (md.get("discount_code") or "").strip()
 
-            PurchasedPackage.objects.create(
-                employer=employer,
-                package=package,
-                credits_granted=int(package.credits),
-                credits_remaining=int(package.credits),
-                duration_days=int(package.duration_days),
-                source="stripe",
-            )
+        # Prevent duplicates if refreshing success page: the (processor, processor_reference) unique
+        # constraint rejects a second invoice for this session, and the purchase rolls back with it
+        try:
+            with transaction.atomic():
+                Invoice.objects.create(
+                    employer=employer,
+                    amount=paid_amount,
+                    currency="CAD",
+                    processor="stripe",
+                    status="paid",
+                    processor_reference=session_id,
+                    discount_code=used_code,
+                )
+                PurchasedPackage.objects.grant(employer, package, source="stripe")
+        except IntegrityError:
+            pass
+        else:
             _sync_employer_credits(employer)
 
             send_templated_email(
@@ -1085,7 +1093,7 @@ def checkout_success(request: HttpRequest) -> HttpResponse:
         return render(
             request,
             "checkout/checkout_success.html",
-            {"sitesettings": SiteSettings.objects.first(), "package": package},
+            {"sitesettings": SiteSettings.objects.current(), "package": package},
         )
 
     return redirect("package_list")
@@ -1099,7 +1107,7 @@ def paypal_success(request: HttpRequest) -> HttpResponse:
     employer = request.user.employer
     package_id = request.GET.get("package_id")
     amount = request.GET.get("amount")
-    discount_code = (request.GET.get("discount_code") or "").strip() or None
+    discount_code = (request.GET.get("discount_code") or "").strip()
 
     if not package_id:
         return redirect("package_list")
@@ -1119,17 +1127,10 @@ def paypal_success(request: HttpRequest) -> HttpResponse:
             currency="CAD",
             processor="paypal",
             status="paid",
-            processor_reference=None,
+            processor_reference="",
             discount_code=discount_code,
         )
-        PurchasedPackage.objects.create(
-            employer=employer,
-            package=package,
-            credits_granted=int(package.credits),
-            credits_remaining=int(package.credits),
-            duration_days=int(package.duration_days),
-            source="paypal",
-        )
+        PurchasedPackage.objects.grant(employer, package, source="paypal")
         _sync_employer_credits(employer)
 
         send_templated_email(
@@ -1141,7 +1142,7 @@ def paypal_success(request: HttpRequest) -> HttpResponse:
     return render(
         request,
         "checkout/checkout_success.html",
-        {"sitesettings": SiteSettings.objects.first(), "package": package},
+        {"sitesettings": SiteSettings.objects.current(), "package": package},
     )
 
 
@@ -1216,7 +1217,7 @@ def invoice_detail(request: HttpRequest, invoice_id: int) -> HttpResponse:
         request,
         "billing/invoice_detail.html",
         {
-            "sitesettings": SiteSettings.objects.first(),
+            "sitesettings": SiteSettings.objects.current(),
             "invoice": invoice,
             "employer": employer,
         },
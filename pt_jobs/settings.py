@@ -105,6 +105,27 @@ else:
         }
     }
 
+# ==============================================================================
+# Cache (Railway Redis via REDIS_URL)
+# ==============================================================================
+# board caches the package list and SiteSettings, and clears them on save/delete. Only a shared cache
+# makes that invalidation reach every gunicorn worker. Without REDIS_URL each worker keeps its own
+# in-process cache, so after an admin edit other workers can serve the old value for up to 300s.
+REDIS_URL = os.environ.get("REDIS_URL", "").strip()
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
 # ==============================================================================
 # Password validation
 # ==============================================================================